@@ -0,0 +1,113 @@
+from __future__ import annotations
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import Manager
+
+from batch import ENGINES, SolveResult, solve_puzzle
+from utils import CancellationToken
+
+EXECUTORS = ("thread", "process")
+
+_local = threading.local()
+_default_solver = None
+
+
+def solve_in_worker(
+    puzzle: list[list[int]],
+    engine: str,
+    propagate: bool,
+    timeout: float | None,
+    max_nodes: int | None,
+    token: CancellationToken,
+) -> SolveResult:
+    if (engine_sudokus := getattr(_local, "sudokus", None)) is None:
+        engine_sudokus = _local.sudokus = {}
+
+    sudokus = engine_sudokus.setdefault(engine, {})
+    return solve_puzzle(sudokus, puzzle, engine, propagate, timeout, max_nodes, token)
+
+
+class AsyncSolver:
+    def __init__(self, executor: str = "process", max_concurrency: int | None = None) -> None:
+        if executor not in EXECUTORS:
+            raise ValueError(f"Executor must be one of {EXECUTORS}.")
+
+        # Solvers hold the GIL, so extra solver threads add no throughput and only slow the event loop down.
+        if max_concurrency is None:
+            max_concurrency = (os.cpu_count() or 1) if executor == "process" else 1
+
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be positive.")
+
+        self.max_concurrency = max_concurrency
+        self.loop = None
+        self.semaphore = None
+        if executor == "thread":
+            self.executor = ThreadPoolExecutor(max_concurrency)
+            self.manager = None
+        else:
+            self.executor = ProcessPoolExecutor(max_concurrency)
+            self.manager = Manager()
+
+    async def __aenter__(self) -> AsyncSolver:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_semaphore(self) -> asyncio.Semaphore:
+        if (loop := asyncio.get_running_loop()) is not self.loop:
+            self.loop = loop
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self.semaphore
+
+    def new_token(self) -> CancellationToken:
+        if self.manager is None:
+            return CancellationToken()
+
+        return CancellationToken(self.manager.Event())
+
+    async def solve(
+        self,
+        puzzle: list[list[int]],
+        engine: str = "array",
+        propagate: bool = False,
+        timeout: float | None = None,
+        max_nodes: int | None = None,
+    ) -> SolveResult:
+        if engine not in ENGINES:
+            raise ValueError(f"Engine must be one of {ENGINES}.")
+
+        async with self.get_semaphore():
+            token = self.new_token()
+            future = asyncio.get_running_loop().run_in_executor(
+                self.executor, solve_in_worker, puzzle, engine, propagate, timeout, max_nodes, token
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                token.cancel()
+                await asyncio.wait([future])
+                raise
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        if self.manager is not None:
+            self.manager.shutdown()
+
+
+async def solve_async(
+    puzzle: list[list[int]],
+    engine: str = "array",
+    propagate: bool = False,
+    timeout: float | None = None,
+    max_nodes: int | None = None,
+) -> SolveResult:
+    global _default_solver
+    if _default_solver is None:
+        _default_solver = AsyncSolver()
+
+    return await _default_solver.solve(puzzle, engine, propagate, timeout, max_nodes)
@@ -0,0 +1,235 @@
+import os
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from functools import partial
+from itertools import islice
+from math import isqrt
+from multiprocessing import Pool
+from typing import NamedTuple
+
+from sudoku import Sudoku
+from utils import CancellationToken, SearchLimits, TimedOut
+
+ENGINES = ("list", "array", "bitmask", "backtrack")
+
+_worker_sudokus = {}
+
+
+class SolveResult(NamedTuple):
+    solution: list[list[int]] | None
+    status: str
+    elapsed: float
+
+
+def get_quad_dim(puzzle: list[list[int]]) -> int:
+    quad_dim = isqrt(len(puzzle))
+    if quad_dim < 1 or quad_dim**2 != len(puzzle):
+        raise ValueError("Puzzle side must be a square of an int.")
+
+    return quad_dim
+
+
+def new_sudoku(quad_dim: int, engine: str) -> Sudoku:
+    return Sudoku(quad_dim, engine="list" if engine == "list" else "array")
+
+
+def new_limits(
+    timeout: float | None = None, max_nodes: int | None = None, token: CancellationToken | None = None
+) -> SearchLimits | None:
+    if timeout is None and max_nodes is None and token is None:
+        return None
+
+    return SearchLimits(timeout, max_nodes, token)
+
+
+def solve_sudoku(
+    sudoku: Sudoku, engine: str, propagate: bool = False, limits: SearchLimits | None = None
+) -> bool | TimedOut:
+    match engine:
+        case "list" | "array":
+            if not (is_solved := sudoku.xsolve(propagate, limits=limits)):
+                return is_solved
+
+            sudoku.xfield_to_field()
+            return True
+        case "bitmask":
+            return sudoku.bsolve(propagate, limits)
+        case "backtrack":
+            if propagate and not sudoku.propagate():
+                return False
+
+            return sudoku.solve(limits=limits)
+        case _:
+            raise ValueError(f"Engine must be one of {ENGINES}.")
+
+
+def solve_puzzle(
+    sudokus: dict[int, Sudoku],
+    puzzle: list[list[int]],
+    engine: str,
+    propagate: bool = False,
+    timeout: float | None = None,
+    max_nodes: int | None = None,
+    token: CancellationToken | None = None,
+) -> SolveResult:
+    start_time = time.perf_counter()
+    limits = new_limits(timeout, max_nodes, token)
+    try:
+        quad_dim = get_quad_dim(puzzle)
+        if (sudoku := sudokus.get(quad_dim)) is None:
+            sudoku = sudokus[quad_dim] = new_sudoku(quad_dim, engine)
+
+        sudoku.set_field([list(row) for row in puzzle])
+    except (TypeError, ValueError):
+        return SolveResult(None, "invalid", time.perf_counter() - start_time)
+
+    if not sudoku.check_field():
+        return SolveResult(None, "invalid", time.perf_counter() - start_time)
+
+    if isinstance(is_solved := solve_sudoku(sudoku, engine, propagate, limits), TimedOut):
+        status = "cancelled" if is_solved.reason == "cancelled" else "timeout"
+        return SolveResult(None, status, time.perf_counter() - start_time)
+
+    if not is_solved:
+        return SolveResult(None, "unsolvable", time.perf_counter() - start_time)
+
+    return SolveResult(sudoku.get_field(), "solved", time.perf_counter() - start_time)
+
+
+def solve_many(
+    puzzles: Iterable[list[list[int]]],
+    engine: str = "array",
+    propagate: bool = False,
+    timeout: float | None = None,
+    max_nodes: int | None = None,
+    token: CancellationToken | None = None,
+) -> Iterator[SolveResult]:
+    if engine not in ENGINES:
+        raise ValueError(f"Engine must be one of {ENGINES}.")
+
+    sudokus = {}
+    for puzzle in puzzles:
+        yield solve_puzzle(sudokus, puzzle, engine, propagate, timeout, max_nodes, token)
+
+
+def iter_chunks(puzzles: Iterable[list[list[int]]], chunk_size: int) -> Iterator[list[list[list[int]]]]:
+    iterator = iter(puzzles)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def solve_chunk(
+    chunk: list[list[list[int]]],
+    engine: str,
+    propagate: bool = False,
+    timeout: float | None = None,
+    max_nodes: int | None = None,
+) -> list[SolveResult]:
+    sudokus = _worker_sudokus.setdefault(engine, {})
+    return [solve_puzzle(sudokus, puzzle, engine, propagate, timeout, max_nodes) for puzzle in chunk]
+
+
+def solve_many_parallel(
+    puzzles: Iterable[list[list[int]]],
+    engine: str = "array",
+    propagate: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 64,
+    timeout: float | None = None,
+    max_nodes: int | None = None,
+) -> Iterator[SolveResult]:
+    if engine not in ENGINES:
+        raise ValueError(f"Engine must be one of {ENGINES}.")
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("Workers count must be positive.")
+
+    with Pool(workers) as pool:
+        pending = deque()
+        for chunk in iter_chunks(puzzles, chunk_size):
+            pending.append(pool.apply_async(solve_chunk, (chunk, engine, propagate, timeout, max_nodes)))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().get()
+
+        while pending:
+            yield from pending.popleft().get()
+
+
+def set_branch(sudoku: Sudoku, puzzle: list[list[int]], branch: list[tuple[int, int, int]]) -> None:
+    sudoku.set_field([list(row) for row in puzzle])
+    for row, col, value in branch:
+        sudoku.set_ceil(row, col, value)
+
+
+def split_search(
+    sudoku: Sudoku, puzzle: list[list[int]], size: int
+) -> tuple[list[list[tuple[int, int, int]]], list[list[int]] | None]:
+    frontier = deque([[]])
+    while frontier and len(frontier) < size:
+        branch = frontier.popleft()
+        set_branch(sudoku, puzzle, branch)
+        if (rows := sudoku.get_branches()) is None:
+            return [], sudoku.get_field()
+
+        frontier.extend(branch + [row] for row in rows)
+
+    return list(frontier), None
+
+
+def solve_branch(puzzle: list[list[int]], branch: list[tuple[int, int, int]]) -> list[list[int]] | None:
+    quad_dim = get_quad_dim(puzzle)
+    sudokus = _worker_sudokus.setdefault("array", {})
+    if (sudoku := sudokus.get(quad_dim)) is None:
+        sudoku = sudokus[quad_dim] = new_sudoku(quad_dim, "array")
+
+    set_branch(sudoku, puzzle, branch)
+    if not sudoku.xsolve():
+        return None
+
+    sudoku.xfield_to_field()
+    return sudoku.get_field()
+
+
+def solve_parallel(
+    puzzle: list[list[int]], propagate: bool = False, workers: int | None = None, split_factor: int = 4
+) -> SolveResult:
+    if split_factor < 1:
+        raise ValueError("Split factor must be positive.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("Workers count must be positive.")
+
+    start_time = time.perf_counter()
+    try:
+        sudoku = new_sudoku(get_quad_dim(puzzle), "array")
+        sudoku.set_field([list(row) for row in puzzle])
+    except (TypeError, ValueError):
+        return SolveResult(None, "invalid", time.perf_counter() - start_time)
+
+    if not sudoku.check_field():
+        return SolveResult(None, "invalid", time.perf_counter() - start_time)
+
+    if propagate and not sudoku.propagate():
+        return SolveResult(None, "unsolvable", time.perf_counter() - start_time)
+
+    puzzle = [list(row) for row in sudoku.get_field()]
+    branches, solution = split_search(sudoku, puzzle, workers * split_factor)
+    if solution is not None:
+        return SolveResult(solution, "solved", time.perf_counter() - start_time)
+
+    with Pool(min(workers, len(branches) or 1)) as pool:
+        for solution in pool.imap_unordered(partial(solve_branch, puzzle), branches):
+            if solution is not None:
+                return SolveResult(solution, "solved", time.perf_counter() - start_time)
+
+    return SolveResult(None, "unsolvable", time.perf_counter() - start_time)
@@ -0,0 +1,225 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from copy import deepcopy
+from statistics import mean
+
+from batch import ENGINES
+from formats import parse_line
+from main import get_3_sudoku, get_4_sudoku, get_5_sudoku
+from sudoku import Sudoku
+
+PHASES = ("propagate", "construct", "givens", "search", "extract")
+PERCENTILES = (50, 90, 99)
+
+
+def get_corpora() -> dict[int, list[tuple[str, list[list[int]], tuple[str, ...]]]]:
+    return {
+        3: [
+            ("main_3", get_3_sudoku(), ()),
+            ("inkala_3", parse_line("8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."), ()),
+            ("generated_3_0", parse_line("5...82.4....6.3..9......68...5.7.8...3.8.6.7...1.3.9...14......8..3.7....7.21...8"), ()),
+            ("generated_3_2", parse_line("........1.86...37.....72.4..79.6.5...452.178...8.4.13..1.93.....97...41.4........"), ()),
+            ("generated_3_3", parse_line("..1...5.9..6.8..73.5.1....68..51......7...9......62..87....3.1.61..5.7..5.3...6.."), ()),
+        ],
+        4: [
+            ("main_4_1", get_4_sudoku(1), ("backtrack",)),
+            ("main_4_2", get_4_sudoku(2), ("backtrack",)),
+            (
+                "generated_4",
+                parse_line(
+                    ".25..BD.49F....7...1A..73.EC.....4F7...95..D.2.G..A....5B8.GED..7.4DF2.6..8.95.3BEC598G..."
+                    "6.2F7.A.9.....C.2...G6F..2C3.E.....4..DA...9...C..G6.1.7..G.6BED9A832.298.3..A...F.B5C3G..."
+                    "42C15.8.9A.GDE...8....34..56...B.3..E..F.8D4F.95A.2.G..6...1...D.94F.A..G32"
+                ),
+                (),
+            ),
+        ],
+        5: [
+            ("main_5", get_5_sudoku(), ENGINES),
+            (
+                "generated_5",
+                parse_line(
+                    "KT...WHJROPYUG.B..C.AMS.DI.ELU..FBYDQ.....GS..N.......SEK..CB.MOI..NTJX.LHF"
+                    ".BVGJALI.MT...NPO.UX.KQY.WF.......V..KLXH.Y..R.B.PQ..IWX.DMA.UV..F..RSNT.CK"
+                    "NM.XLS.V.POI.K.QH..WF.R.GEV..RJ.YGUH....MBK.IWOXQLO..TK..B.RXEQC...AGP.I..Y"
+                    "..G...IHQ..ALR..CTXVUE..SJEM.C.U.OQ...VGX.....YAW.AHOBFYTEXSCMNQK.IV.ULR.PJ"
+                    "XWSYNH..KFIJEBP.MLA..UOVT.....MJAL.Y.TWU.KQN.BHCFETLIU.CP.VBAOF.RYE.JDG.KNM"
+                    "...AOURN...TH.VEF.M.PQG..MUK..F.C.L.RGA.V..PNHJIO.RXW.YKOP.E.BCMF...H.T.NA."
+                    "CGNJ.TMS.DUL.X..WBQK..ERV.QFPIBVX.GE..N.A...TK.ML...CSAIYL..VGB.QD......JKR"
+                    "YIRHPVS.EXM.AJLOGU.CD..TQF.L.EGW.UJRPODH...KBCVYXA.K.M.D........Y..JVQ...EN"
+                    "DJX..R.QPTFK.E.NYML.OSUGH"
+                ),
+                (),
+            ),
+        ],
+    }
+
+
+def get_percentile(samples: list[float], percent: int) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    summary = {"min": min(samples), "mean": mean(samples)}
+    summary.update((f"p{percent}", get_percentile(samples, percent)) for percent in PERCENTILES)
+    return summary
+
+
+def run_once(sudoku: Sudoku, puzzle: list[list[int]], engine: str, propagate: bool) -> tuple[bool, dict[str, float]]:
+    sudoku.set_field(deepcopy(puzzle))
+    timings = {}
+
+    start_time = time.perf_counter()
+    if propagate:
+        is_solved = sudoku.propagate()
+        timings["propagate"] = time.perf_counter() - start_time
+        if not is_solved:
+            timings["total"] = timings["propagate"]
+            return False, timings
+
+    match engine:
+        case "list" | "array":
+            phase_time = time.perf_counter()
+            sudoku.clear_xfield()
+            timings["construct"] = time.perf_counter() - phase_time
+
+            phase_time = time.perf_counter()
+            sudoku.field_to_xfield()
+            timings["givens"] = time.perf_counter() - phase_time
+
+            phase_time = time.perf_counter()
+            is_solved = sudoku.xsolve()
+            timings["search"] = time.perf_counter() - phase_time
+
+            phase_time = time.perf_counter()
+            sudoku.xfield_to_field()
+            timings["extract"] = time.perf_counter() - phase_time
+        case "bitmask":
+            phase_time = time.perf_counter()
+            is_solved = sudoku.bsolve()
+            timings["search"] = time.perf_counter() - phase_time
+        case "backtrack":
+            phase_time = time.perf_counter()
+            is_solved = sudoku.solve()
+            timings["search"] = time.perf_counter() - phase_time
+        case _:
+            raise ValueError(f"Engine must be one of {ENGINES}.")
+
+    timings["total"] = time.perf_counter() - start_time
+    return is_solved, timings
+
+
+def run_case(
+    quad_dim: int, puzzle: list[list[int]], engine: str, warmup: int, repeat: int, propagate: bool
+) -> dict:
+    sudoku = Sudoku(quad_dim, engine="list" if engine == "list" else "array")
+    for _ in range(warmup):
+        run_once(sudoku, puzzle, engine, propagate)
+
+    is_solved = True
+    samples = {}
+    for _ in range(repeat):
+        is_run_solved, timings = run_once(sudoku, puzzle, engine, propagate)
+        is_solved &= is_run_solved
+        for phase, elapsed in timings.items():
+            samples.setdefault(phase, []).append(elapsed)
+
+    phases = {phase: summarize(samples[phase]) for phase in (*PHASES, "total") if phase in samples}
+    return {"solved": is_solved, "phases": phases}
+
+
+def run_benchmark(
+    dims: list[int],
+    engines: list[str],
+    warmup: int = 1,
+    repeat: int = 5,
+    propagate: bool = False,
+    include_slow: bool = False,
+) -> dict:
+    corpora = get_corpora()
+    results = []
+    for quad_dim in dims:
+        for name, puzzle, slow_engines in corpora[quad_dim]:
+            for engine in engines:
+                if engine in slow_engines and not include_slow:
+                    continue
+
+                result = run_case(quad_dim, puzzle, engine, warmup, repeat, propagate)
+                results.append({"quad_dim": quad_dim, "puzzle": name, "engine": engine, **result})
+
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "propagate": propagate,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.1, stat: str = "p50") -> list[str]:
+    baseline_results = {(result["puzzle"], result["engine"]): result for result in baseline["results"]}
+
+    regressions = []
+    for result in report["results"]:
+        if (old_result := baseline_results.get((result["puzzle"], result["engine"]))) is None:
+            continue
+
+        old_time = old_result["phases"]["total"][stat]
+        new_time = result["phases"]["total"][stat]
+        if new_time > old_time * (1 + threshold):
+            regressions.append(
+                f"{result['puzzle']} [{result['engine']}]: {old_time:.6f}s -> {new_time:.6f}s "
+                f"(+{(new_time / old_time - 1) * 100:.1f}%)"
+            )
+
+    return regressions
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark sudoku solving engines.")
+    parser.add_argument("--dims", type=int, nargs="+", choices=(3, 4, 5), default=[3, 4, 5])
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--propagate", action="store_true")
+    parser.add_argument("--slow", action="store_true", help="include cases that take minutes to solve")
+    parser.add_argument("--output", help="write the JSON report to this path instead of stdout")
+    parser.add_argument("--baseline", help="compare against a stored JSON report")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> int:
+    args = parse_args(args)
+    if args.repeat < 1 or args.warmup < 0:
+        raise ValueError("Repeat must be positive and warmup non-negative.")
+
+    report = run_benchmark(args.dims, args.engines, args.warmup, args.repeat, args.propagate, args.slow)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(report, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print("Regression:", regression, file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
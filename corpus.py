@@ -0,0 +1,143 @@
+from __future__ import annotations
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+MAGIC = b"SDKC"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBxQ")
+
+
+def get_bits(quad_dim: int) -> int:
+    return (quad_dim**2).bit_length()
+
+
+def get_record_size(quad_dim: int) -> int:
+    return (quad_dim**4 * get_bits(quad_dim) + 7) // 8
+
+
+def pack_field(field: list[list[int]], quad_dim: int) -> bytes:
+    dim = quad_dim**2
+    bits = get_bits(quad_dim)
+    if len(field) != dim or any(len(row) != dim for row in field):
+        raise ValueError(f"Field must be {dim}x{dim}.")
+
+    packed = 0
+    shift = 0
+    for row in field:
+        for value in row:
+            if not 0 <= value <= dim:
+                raise ValueError(f"Field values must be between 0 and {dim}.")
+
+            packed |= value << shift
+            shift += bits
+
+    return packed.to_bytes(get_record_size(quad_dim), "little")
+
+
+def unpack_field(record: bytes | memoryview, quad_dim: int) -> list[list[int]]:
+    dim = quad_dim**2
+    bits = get_bits(quad_dim)
+    mask = (1 << bits) - 1
+
+    packed = int.from_bytes(record, "little")
+    cells = [(packed >> (bits * i)) & mask for i in range(dim**2)]
+    return [cells[i : i + dim] for i in range(0, dim**2, dim)]
+
+
+class CorpusWriter:
+    def __init__(self, path: str | Path, quad_dim: int = 3) -> None:
+        if quad_dim < 1:
+            raise ValueError("Quad dim must be positive.")
+
+        self.quad_dim = quad_dim
+        self.length = 0
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, quad_dim, get_bits(quad_dim), 0))
+
+    def __enter__(self) -> CorpusWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def write(self, field: list[list[int]]) -> None:
+        self.file.write(pack_field(field, self.quad_dim))
+        self.length += 1
+
+    def write_many(self, fields: Iterable[list[list[int]]]) -> None:
+        for field in fields:
+            self.write(field)
+
+    def close(self) -> None:
+        if self.file.closed:
+            return None
+
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.quad_dim, get_bits(self.quad_dim), self.length))
+        self.file.close()
+
+
+class CorpusReader:
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.buffer) < HEADER.size:
+            self.buffer.close()
+            raise ValueError("Corpus header is truncated.")
+
+        magic, version, self.quad_dim, bits, self.length = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION or bits != get_bits(self.quad_dim):
+            self.buffer.close()
+            raise ValueError("Invalid corpus header.")
+
+        self.record_size = get_record_size(self.quad_dim)
+        if len(self.buffer) < HEADER.size + self.length * self.record_size:
+            self.buffer.close()
+            raise ValueError("Corpus records are truncated.")
+
+        self.view = memoryview(self.buffer)
+
+    def __enter__(self) -> CorpusReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, idx: int) -> list[list[int]]:
+        if idx < 0:
+            idx += self.length
+
+        if not 0 <= idx < self.length:
+            raise IndexError("Puzzle index out of range")
+
+        offset = HEADER.size + idx * self.record_size
+        return unpack_field(self.view[offset : offset + self.record_size], self.quad_dim)
+
+    def __iter__(self) -> Iterator[list[list[int]]]:
+        return self.iter_range()
+
+    def iter_range(self, start: int = 0, stop: int | None = None) -> Iterator[list[list[int]]]:
+        for idx in range(*slice(start, stop).indices(self.length)):
+            yield self[idx]
+
+    def close(self) -> None:
+        if self.buffer.closed:
+            return None
+
+        self.view.release()
+        self.buffer.close()
+
+
+def write_corpus(path: str | Path, fields: Iterable[list[list[int]]], quad_dim: int = 3) -> int:
+    with CorpusWriter(path, quad_dim) as writer:
+        writer.write_many(fields)
+        return len(writer)
@@ -0,0 +1,163 @@
+import json
+import mmap
+import sys
+from collections.abc import Iterable, Iterator
+from math import isqrt
+from pathlib import Path
+from typing import TextIO
+
+FORMATS = ("line", "sdm", "jsonl")
+
+ALPHABETS = {
+    1: "1",
+    2: "1234",
+    3: "123456789",
+    4: "123456789ABCDEFG",
+    5: "ABCDEFGHIJKLMNOPQRSTUVWXY",
+}
+
+EMPTY_CHARS = ".0"
+
+
+def get_format(path: str | Path) -> str:
+    match Path(path).suffix.lower():
+        case ".jsonl":
+            return "jsonl"
+        case ".sdm":
+            return "sdm"
+        case _:
+            return "line"
+
+
+def get_alphabet(quad_dim: int, alphabet: str | None = None) -> str:
+    if alphabet is None:
+        if (alphabet := ALPHABETS.get(quad_dim)) is None:
+            raise ValueError(f"No default alphabet for quad dim {quad_dim}.")
+
+    if len(alphabet) != quad_dim**2 or len(set(alphabet)) != len(alphabet):
+        raise ValueError(f"Alphabet must have {quad_dim**2} distinct chars.")
+
+    return alphabet
+
+
+def parse_line(line: str, alphabet: str | None = None) -> list[list[int]]:
+    line = "".join(line.split())
+    dim = isqrt(len(line))
+    quad_dim = isqrt(dim)
+    if dim < 1 or dim**2 != len(line) or quad_dim**2 != dim:
+        raise ValueError(f"Line length {len(line)} is not a sudoku size.")
+
+    alphabet = get_alphabet(quad_dim, alphabet)
+    values = {char: value for value, char in enumerate(alphabet, 1)}
+    values.update((char, 0) for char in EMPTY_CHARS if char not in values)
+
+    try:
+        cells = [values[char] for char in line]
+    except KeyError as error:
+        raise ValueError(f"Invalid char {error.args[0]!r} in line.") from None
+
+    return [cells[i : i + dim] for i in range(0, dim**2, dim)]
+
+
+def format_line(field: list[list[int]], alphabet: str | None = None, empty: str = ".") -> str:
+    alphabet = get_alphabet(isqrt(len(field)), alphabet)
+    if empty in alphabet:
+        raise ValueError(f"Empty char {empty!r} clashes with alphabet.")
+
+    return "".join(alphabet[value - 1] if value else empty for row in field for value in row)
+
+
+def parse_json(line: str, alphabet: str | None = None) -> list[list[int]]:
+    puzzle = json.loads(line)
+    if isinstance(puzzle, dict):
+        puzzle = puzzle["puzzle"]
+
+    if isinstance(puzzle, str):
+        return parse_line(puzzle, alphabet)
+
+    return puzzle
+
+
+def format_json(field: list[list[int]]) -> str:
+    return json.dumps(field, separators=(",", ":"))
+
+
+def iter_mmap_lines(path: str | Path) -> Iterator[str]:
+    with open(path, "rb") as file:
+        if Path(path).stat().st_size == 0:
+            return None
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            while line := buffer.readline():
+                yield line.decode()
+
+
+def iter_lines(source: str | Path | TextIO, use_mmap: bool = False) -> Iterator[str]:
+    if not isinstance(source, (str, Path)):
+        yield from source
+        return None
+
+    if str(source) == "-":
+        if use_mmap:
+            raise ValueError("Stdin can not be memory mapped.")
+
+        yield from sys.stdin
+        return None
+
+    if use_mmap:
+        yield from iter_mmap_lines(source)
+        return None
+
+    with open(source) as file:
+        yield from file
+
+
+def read_puzzles(
+    source: str | Path | TextIO, fmt: str | None = None, alphabet: str | None = None, use_mmap: bool = False
+) -> Iterator[list[list[int]]]:
+    if fmt is None:
+        fmt = get_format(source) if isinstance(source, (str, Path)) else "line"
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Format must be one of {FORMATS}.")
+
+    parse = parse_json if fmt == "jsonl" else parse_line
+    for line in iter_lines(source, use_mmap):
+        if not (line := line.strip()) or line.startswith("#"):
+            continue
+
+        yield parse(line, alphabet)
+
+
+def write_puzzles(
+    puzzles: Iterable[list[list[int]]],
+    target: str | Path | TextIO,
+    fmt: str | None = None,
+    alphabet: str | None = None,
+) -> int:
+    if fmt is None:
+        fmt = get_format(target) if isinstance(target, (str, Path)) else "line"
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Format must be one of {FORMATS}.")
+
+    if not isinstance(target, (str, Path)):
+        return write_lines(puzzles, target, fmt, alphabet)
+
+    if str(target) == "-":
+        return write_lines(puzzles, sys.stdout, fmt, alphabet)
+
+    with open(target, "w") as file:
+        return write_lines(puzzles, file, fmt, alphabet)
+
+
+def write_lines(puzzles: Iterable[list[list[int]]], file: TextIO, fmt: str, alphabet: str | None = None) -> int:
+    count = 0
+    for puzzle in puzzles:
+        if fmt == "jsonl":
+            file.write(format_json(puzzle) + "\n")
+        else:
+            file.write(format_line(puzzle, alphabet, "." if fmt == "line" else "0") + "\n")
+        count += 1
+
+    return count
@@ -0,0 +1,136 @@
+from random import Random
+
+from sudoku import Sudoku
+
+SYMMETRIES = ("none", "rotational", "horizontal", "vertical", "diagonal", "full")
+
+
+def get_rng(rng: Random | int | None = None) -> Random:
+    if isinstance(rng, Random):
+        return rng
+
+    return Random(rng)
+
+
+def shuffle_grid(field: list[list[int]], quad_dim: int, rng: Random) -> list[list[int]]:
+    order = []
+    for _ in range(2):
+        bands = list(range(quad_dim))
+        rng.shuffle(bands)
+        lines = []
+        for band in bands:
+            band_lines = list(range(band * quad_dim, (band + 1) * quad_dim))
+            rng.shuffle(band_lines)
+            lines.extend(band_lines)
+        order.append(lines)
+
+    rows, cols = order
+    return [[field[row][col] for col in cols] for row in rows]
+
+
+def generate_grid(quad_dim: int = 3, rng: Random | int | None = None) -> list[list[int]]:
+    rng = get_rng(rng)
+    dim = quad_dim**2
+
+    while True:
+        field = [[0 for _ in range(dim)] for _ in range(dim)]
+        for quad in range(quad_dim):
+            values = list(range(1, dim + 1))
+            rng.shuffle(values)
+            for i, value in enumerate(values):
+                field[quad * quad_dim + i // quad_dim][quad * quad_dim + i % quad_dim] = value
+
+        sudoku = Sudoku(quad_dim, field)
+        if sudoku.bsolve():
+            return shuffle_grid(sudoku.get_field(), quad_dim, rng)
+
+
+def get_orbit(row: int, col: int, dim: int, symmetry: str) -> tuple[tuple[int, int], ...]:
+    last = dim - 1
+    match symmetry:
+        case "none":
+            cells = {(row, col)}
+        case "rotational":
+            cells = {(row, col), (last - row, last - col)}
+        case "horizontal":
+            cells = {(row, col), (row, last - col)}
+        case "vertical":
+            cells = {(row, col), (last - row, col)}
+        case "diagonal":
+            cells = {(row, col), (col, row)}
+        case "full":
+            cells = set()
+            for r, c in ((row, col), (col, row)):
+                cells.update(((r, c), (r, last - c), (last - r, c), (last - r, last - c)))
+        case _:
+            raise ValueError(f"Symmetry must be one of {SYMMETRIES}.")
+
+    return tuple(sorted(cells))
+
+
+def get_orbits(dim: int, symmetry: str) -> list[tuple[tuple[int, int], ...]]:
+    return sorted({get_orbit(row, col, dim, symmetry) for row in range(dim) for col in range(dim)})
+
+
+def is_propagated(scratch: Sudoku, field: list[list[int]]) -> bool:
+    scratch.set_field([row[:] for row in field])
+    return scratch.propagate() and scratch.is_filled()
+
+
+def has_other_solution(sudoku: Sudoku, orbit: tuple[tuple[int, int], ...], solution: list[list[int]]) -> bool:
+    for row, col in orbit:
+        for value in range(1, len(solution) + 1):
+            if value == solution[row][col] or not sudoku.set_ceil(row + 1, col + 1, value):
+                continue
+
+            is_solved = sudoku.xsolve()
+            sudoku.set_ceil(row + 1, col + 1, 0)
+            if is_solved:
+                return True
+
+    return False
+
+
+def generate_puzzle(
+    quad_dim: int = 3,
+    target_clues: int | None = None,
+    symmetry: str = "none",
+    rng: Random | int | None = None,
+) -> tuple[list[list[int]], list[list[int]]]:
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Symmetry must be one of {SYMMETRIES}.")
+
+    rng = get_rng(rng)
+    dim = quad_dim**2
+
+    solution = generate_grid(quad_dim, rng)
+    orbits = get_orbits(dim, symmetry)
+    rng.shuffle(orbits)
+
+    sudoku = Sudoku(quad_dim, engine="array")
+    scratch = Sudoku(quad_dim, engine="array")
+    sudoku.sync_xfield()
+    for orbit in reversed(orbits):
+        for row, col in orbit:
+            sudoku.set_ceil(row + 1, col + 1, solution[row][col])
+
+    clues = dim**2
+    for orbit in orbits:
+        if target_clues is not None:
+            if clues <= target_clues:
+                break
+
+            if clues - len(orbit) < target_clues:
+                continue
+
+        for row, col in orbit:
+            sudoku.set_ceil(row + 1, col + 1, 0)
+
+        if is_propagated(scratch, sudoku.get_field()) or not has_other_solution(sudoku, orbit, solution):
+            clues -= len(orbit)
+            continue
+
+        for row, col in orbit:
+            sudoku.set_ceil(row + 1, col + 1, solution[row][col])
+
+    return [row[:] for row in sudoku.get_field()], solution
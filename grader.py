@@ -0,0 +1,54 @@
+from typing import NamedTuple
+
+from batch import get_quad_dim
+from sudoku import Sudoku
+from utils import SearchStats
+
+RATINGS = ("easy", "medium", "hard", "expert", "extreme")
+BACKTRACK_LIMITS = (3, 30)
+
+
+class Grade(NamedTuple):
+    rating: str
+    technique: str
+    nodes: int
+    backtracks: int
+    max_depth: int
+    branching: float
+
+
+def get_rating(technique: str, stats: SearchStats) -> str:
+    if stats.nodes == 0:
+        return "medium" if technique == "intersection" else "easy"
+
+    for rating, limit in zip(RATINGS[2:], BACKTRACK_LIMITS):
+        if stats.backtracks <= limit:
+            return rating
+
+    return RATINGS[-1]
+
+
+def grade_puzzle(puzzle: list[list[int]], engine: str = "array") -> Grade:
+    sudoku = Sudoku(get_quad_dim(puzzle), [list(row) for row in puzzle], engine)
+    if not sudoku.check_field():
+        raise ValueError("Puzzle has clashing givens.")
+
+    if not sudoku.propagate():
+        raise ValueError("Puzzle has no solution.")
+
+    technique = sudoku.get_technique()
+    if sudoku.is_filled():
+        stats = SearchStats()
+    elif sudoku.xsolve(instrument=True):
+        stats = sudoku.get_stats()
+    else:
+        raise ValueError("Puzzle has no solution.")
+
+    return Grade(
+        get_rating(technique, stats),
+        technique,
+        stats.nodes,
+        stats.backtracks,
+        stats.max_depth,
+        stats.get_branching(),
+    )
@@ -1,5 +1,7 @@
 import time
+from copy import deepcopy
 
+from formats import parse_line
 from sudoku import Sudoku
 
 def get_3_sudoku() -> list:
@@ -66,142 +68,34 @@ def get_4_sudoku(num: int) -> list:
         
 
 def get_5_sudoku() -> list:
-    letters = {
-        "A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6, "G": 7, "H": 8, "I": 9, "J": 10,
-        "K": 11, "L": 12, "M": 13, "N": 14, "O": 15, "P": 16, "Q": 17, "R": 18, "S": 19, "T": 20,
-        "U": 21, "V": 22, "W": 23, "X": 24, "Y": 25, "Z": 0
-    }
-    sudoku_field = [
-        [letters["Z"], letters["Z"], letters["L"], letters["Z"], letters["Z"],
-         letters["Z"], letters["U"], letters["Z"], letters["Z"], letters["K"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["G"], letters["Z"],
-         letters["Z"], letters["Z"], letters["I"], letters["Z"], letters["X"]],
-        [letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Q"],
-         letters["H"], letters["Z"], letters["R"], letters["Z"], letters["Z"],
-         letters["K"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["V"], letters["Z"], letters["Z"], letters["Z"],
-         letters["A"], letters["M"], letters["T"], letters["Z"], letters["Z"]],
-        [letters["D"], letters["A"], letters["B"], letters["H"], letters["I"],
-         letters["Z"], letters["Z"], letters["Z"], letters["C"], letters["Z"],
-         letters["Z"], letters["Z"], letters["X"], letters["T"], letters["Z"],
-         letters["Z"], letters["F"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["V"], letters["K"]],
-        [letters["Z"], letters["V"], letters["X"], letters["W"], letters["Z"],
-         letters["Z"], letters["D"], letters["J"], letters["E"], letters["Z"],
-         letters["Z"], letters["Z"], letters["I"], letters["R"], letters["A"],
-         letters["Z"], letters["Z"], letters["O"], letters["Z"], letters["Z"],
-         letters["C"], letters["H"], letters["Z"], letters["Z"], letters["Z"]],
-        [letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["X"], letters["F"], letters["Z"], letters["B"], letters["W"],
-         letters["Q"], letters["D"], letters["Z"], letters["Z"], letters["L"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["O"], letters["Z"], letters["Z"]],
-
-        [letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Q"], letters["I"], letters["U"], letters["Z"], letters["Z"],
-         letters["Z"], letters["O"], letters["Z"], letters["S"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["R"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["N"]],
-        [letters["Z"], letters["Z"], letters["Z"], letters["E"], letters["Z"],
-         letters["F"], letters["V"], letters["K"], letters["Z"], letters["J"],
-         letters["Z"], letters["Z"], letters["Z"], letters["P"], letters["Q"],
-         letters["Z"], letters["Z"], letters["L"], letters["Z"], letters["A"],
-         letters["M"], letters["I"], letters["Y"], letters["Z"], letters["H"]],
-        [letters["Z"], letters["Z"], letters["F"], letters["Z"], letters["C"],
-         letters["Z"], letters["R"], letters["A"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["N"], letters["U"], letters["G"],
-         letters["Z"], letters["Z"], letters["Z"], letters["I"], letters["W"],
-         letters["S"], letters["Z"], letters["Z"], letters["B"], letters["Z"]],
-        [letters["Z"], letters["I"], letters["Z"], letters["Q"], letters["H"],
-         letters["Z"], letters["O"], letters["Y"], letters["Z"], letters["Z"],
-         letters["L"], letters["Z"], letters["Z"], letters["D"], letters["Z"],
-         letters["Z"], letters["B"], letters["Z"], letters["Z"], letters["K"],
-         letters["T"], letters["Z"], letters["U"], letters["Z"], letters["Z"]],
-        [letters["Z"], letters["M"], letters["G"], letters["Z"], letters["Z"],
-         letters["W"], letters["C"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["T"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["J"],
-         letters["Z"], letters["R"], letters["Z"], letters["D"], letters["V"]],
-
-        [letters["M"], letters["Z"], letters["R"], letters["Z"], letters["E"],
-         letters["B"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["D"], letters["Z"], letters["Z"],
-         letters["C"], letters["Z"], letters["Z"], letters["Z"], letters["H"],
-         letters["Z"], letters["A"], letters["Z"], letters["G"], letters["W"]],
-        [letters["Z"], letters["Z"], letters["Z"], letters["P"], letters["W"],
-         letters["Z"], letters["Z"], letters["G"], letters["Z"], letters["Z"],
-         letters["A"], letters["Y"], letters["Z"], letters["Z"], letters["E"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["X"], letters["Z"], letters["N"], letters["Z"], letters["Z"]],
-        [letters["Z"], letters["Z"], letters["Z"], letters["K"], letters["Y"],
-         letters["Z"], letters["Z"], letters["L"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["W"], letters["U"],
-         letters["T"], letters["Z"], letters["N"], letters["D"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"]],
-        [letters["H"], letters["L"], letters["T"], letters["S"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["W"], letters["Z"],
-         letters["Z"], letters["Z"], letters["V"], letters["Z"], letters["K"],
-         letters["X"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Q"], letters["Z"], letters["Z"]],
-        [letters["N"], letters["B"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["H"], letters["Z"], letters["S"], letters["Y"],
-         letters["Z"], letters["P"], letters["Z"], letters["C"], letters["I"],
-         letters["Z"], letters["Z"], letters["E"], letters["Z"], letters["L"],
-         letters["Z"], letters["Z"], letters["Z"], letters["T"], letters["O"]],
-
-        [letters["L"], letters["Q"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["E"], letters["Z"], letters["U"],
-         letters["R"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["B"], letters["I"], letters["Z"], letters["Z"], letters["Z"],
-         letters["D"], letters["Z"], letters["Z"], letters["Z"], letters["T"]],
-        [letters["B"], letters["Z"], letters["Z"], letters["A"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["C"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Y"],
-         letters["S"], letters["Z"], letters["Z"], letters["U"], letters["V"],
-         letters["P"], letters["Z"], letters["Z"], letters["Z"], letters["Z"]],
-        [letters["T"], letters["Z"], letters["Z"], letters["X"], letters["P"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Q"], letters["A"], letters["Z"],
-         letters["Z"], letters["Z"], letters["W"], letters["Z"], letters["Z"],
-         letters["R"], letters["Y"], letters["Z"], letters["C"], letters["Z"]],
-        [letters["Z"], letters["H"], letters["Z"], letters["Z"], letters["N"],
-         letters["Y"], letters["Q"], letters["Z"], letters["Z"], letters["Z"],
-         letters["X"], letters["I"], letters["S"], letters["Z"], letters["Z"],
-         letters["F"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Z"], letters["K"], letters["W"], letters["A"], letters["Z"]],
-        [letters["Z"], letters["Z"], letters["K"], letters["Y"], letters["F"],
-         letters["T"], letters["A"], letters["Z"], letters["Z"], letters["G"],
-         letters["Z"], letters["Z"], letters["P"], letters["N"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["Q"], letters["L"], letters["Z"], letters["Z"], letters["U"]],
-
-        [letters["V"], letters["W"], letters["Z"], letters["Z"], letters["Z"],
-         letters["U"], letters["Z"], letters["P"], letters["Z"], letters["Z"],
-         letters["Z"], letters["H"], letters["Z"], letters["Z"], letters["R"],
-         letters["G"], letters["Z"], letters["X"], letters["Z"], letters["Z"],
-         letters["Z"], letters["N"], letters["M"], letters["Z"], letters["Q"]],
-        [letters["Z"], letters["G"], letters["Z"], letters["O"], letters["Z"],
-         letters["Z"], letters["T"], letters["Z"], letters["Z"], letters["F"],
-         letters["Z"], letters["X"], letters["Z"], letters["B"], letters["N"],
-         letters["M"], letters["Z"], letters["Z"], letters["K"], letters["C"],
-         letters["Z"], letters["Z"], letters["E"], letters["Z"], letters["Y"]],
-        [letters["C"], letters["U"], letters["Z"], letters["Z"], letters["Z"],
-         letters["G"], letters["Y"], letters["N"], letters["O"], letters["S"],
-         letters["Z"], letters["Z"], letters["Z"], letters["I"], letters["Z"],
-         letters["V"], letters["Z"], letters["F"], letters["Z"], letters["Z"],
-         letters["B"], letters["Z"], letters["Z"], letters["Z"], letters["Z"]],
-        [letters["I"], letters["Z"], letters["Z"], letters["Z"], letters["Z"],
-         letters["R"], letters["E"], letters["Z"], letters["Z"], letters["Z"],
-         letters["W"], letters["S"], letters["O"], letters["Z"], letters["J"],
-         letters["Z"], letters["Z"], letters["A"], letters["Z"], letters["Z"],
-         letters["Z"], letters["Z"], letters["K"], letters["Z"], letters["Z"]],
-        [letters["Z"], letters["P"], letters["Z"], letters["Z"], letters["T"],
-         letters["C"], letters["Z"], letters["X"], letters["M"], letters["D"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Q"], letters["Z"],
-         letters["Z"], letters["Z"], letters["Z"], letters["Z"], letters["Y"],
-         letters["Z"], letters["U"], letters["L"], letters["O"], letters["Z"]]
-    ]
+    sudoku_line = (
+        "..L...U..K........G...I.X"
+        "....QH.R..K.....V...AMT.."
+        "DABHI...C...XT..F......VK"
+        ".VXW..DJE...IRA..O..CH..."
+        ".....XF.BWQD..L.......O.."
+        ".....QIU...O.S....R.....N"
+        "...E.FVK.J...PQ..L.AMIY.H"
+        "..F.C.RA....NUG...IWS..B."
+        ".I.QH.OY..L..D..B..KT.U.."
+        ".MG..WC.....T......J.R.DV"
+        "M.R.EB......D..C...H.A.GW"
+        "...PW..G..AY..E.....X.N.."
+        "...KY..L.....WUT.ND......"
+        "HLTS....W...V.KX......Q.."
+        "NB....H.SY.P.CI..E.L...TO"
+        "LQ.....E.UR....BI...D...T"
+        "B..A.....C....YS..UVP...."
+        "T..XP.......QA...W..RY.C."
+        ".H..NYQ...XIS..F.....KWA."
+        "..KYFTA..G..PN......QL..U"
+        "VW...U.P...H..RG.X...NM.Q"
+        ".G.O..T..F.X.BNM..KC..E.Y"
+        "CU...GYNOS...I.V.F..B...."
+        "I....RE...WSO.J..A....K.."
+        ".P..TC.XMD...Q.....Y.ULO."
+    )
+    sudoku_field = parse_line(sudoku_line)
 
     return sudoku_field
 
@@ -214,12 +108,12 @@ def main() -> None:
 
     sudoku = Sudoku(3)
 
-    sudoku.set_field(sudoku_field)
+    sudoku.set_field(deepcopy(sudoku_field))
     print(sudoku)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     is_solved = sudoku.xsolve()
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     xsolve_elapsed_time = end_time - start_time
     sudoku.xfield_to_field()
@@ -230,12 +124,12 @@ def main() -> None:
 
     print("=" * 40, end="\n\n")
 
-    sudoku.set_field(sudoku_field)
+    sudoku.set_field(deepcopy(sudoku_field))
     print(sudoku)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     is_solved = sudoku.solve()
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     solve_elapsed_time = end_time - start_time
     print(sudoku)
@@ -243,6 +137,21 @@ def main() -> None:
     print("Sudoku is solved" if is_solved else "Sudoku is not solved")
     print("Solve elapsed time:", solve_elapsed_time)
 
+    print("=" * 40, end="\n\n")
+
+    sudoku.set_field(deepcopy(sudoku_field))
+    print(sudoku)
+
+    start_time = time.perf_counter()
+    is_solved = sudoku.bsolve()
+    end_time = time.perf_counter()
+
+    bsolve_elapsed_time = end_time - start_time
+    print(sudoku)
+
+    print("Sudoku is solved" if is_solved else "Sudoku is not solved")
+    print("Bsolve elapsed time:", bsolve_elapsed_time)
+
 
 if __name__ == '__main__':
     main()
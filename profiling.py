@@ -0,0 +1,198 @@
+from __future__ import annotations
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+from batch import ENGINES, solve_many
+from formats import read_puzzles
+from main import get_3_sudoku
+
+MODES = ("cprofile", "sampling")
+MIN_SHARE = 1e-4
+
+PHASES = {
+    "clear_xfield": "construct",
+    "__new_xfield": "construct",
+    "__fill_xfield": "construct",
+    "copy": "construct",
+    "field_to_xfield": "construct",
+    "__cover_given": "construct",
+    "cover": "cover",
+    "uncover": "cover",
+    "cover_col": "cover",
+    "uncover_col": "cover",
+    "get_min_col_length": "select",
+    "get_min_col_idxs": "select",
+    "algorithm_x": "search",
+    "bsolve": "search",
+    "solve": "search",
+    "propagate": "propagate",
+    "xfield_to_field": "extract",
+    "get_stack_idxs": "extract",
+}
+
+
+def get_phase(func_names: list[str]) -> str:
+    for func_name in func_names:
+        if (phase := PHASES.get(func_name)) in ("construct", "extract"):
+            return phase
+
+    for func_name in reversed(func_names):
+        if (phase := PHASES.get(func_name)) is not None:
+            return phase
+
+    return "other"
+
+
+def get_label(filename: str, line: int, func_name: str) -> str:
+    return f"{func_name} ({Path(filename).name}:{line})"
+
+
+def get_shares(weights: Counter) -> dict[str, float]:
+    total = sum(weights.values())
+    if total == 0:
+        return {}
+
+    return {phase: weight / total for phase, weight in weights.most_common()}
+
+
+def get_paths(entries: dict, func: tuple, paths: dict, visiting: set) -> list[tuple[tuple, float]]:
+    if func in paths:
+        return paths[func]
+
+    visiting.add(func)
+    callers = {caller: edge[3] for caller, edge in entries[func][4].items() if caller not in visiting}
+    total = sum(callers.values())
+
+    func_paths = []
+    for caller, cumtime in callers.items():
+        if total <= 0 or cumtime <= 0:
+            continue
+
+        for stack, share in get_paths(entries, caller, paths, visiting):
+            if (path_share := share * cumtime / total) >= MIN_SHARE:
+                func_paths.append(((*stack, func), path_share))
+
+    visiting.discard(func)
+    paths[func] = func_paths or [((func,), 1.0)]
+    return paths[func]
+
+
+class Profiler:
+    def __init__(self, prefix: str | Path, mode: str = "cprofile", interval: float = 0.005) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Mode must be one of {MODES}.")
+
+        if interval <= 0:
+            raise ValueError("Sampling interval must be positive.")
+
+        self.prefix = Path(prefix)
+        self.mode = mode
+        self.interval = interval
+        self.phases = {}
+
+        self.profile = None
+        self.samples = Counter()
+        self.thread_id = None
+        self.sampler = None
+        self.stop_event = threading.Event()
+
+    def __enter__(self) -> Profiler:
+        if self.mode == "cprofile":
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+            return self
+
+        self.thread_id = threading.get_ident()
+        self.sampler = threading.Thread(target=self.sample, daemon=True)
+        self.sampler.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.mode == "cprofile":
+            self.profile.disable()
+            self.write_cprofile()
+        else:
+            self.stop_event.set()
+            self.sampler.join()
+            self.write_sampling()
+
+    def sample(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            if (frame := sys._current_frames().get(self.thread_id)) is None:
+                continue
+
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+
+            codes.reverse()
+            self.samples[tuple((code.co_filename, code.co_firstlineno, code.co_name) for code in codes)] += 1
+
+    def write_cprofile(self) -> None:
+        stats = pstats.Stats(self.profile)
+        stats.dump_stats(self.prefix.with_suffix(".pstats"))
+
+        paths = {}
+        stack_times = Counter()
+        for func, (_, _, tottime, _, callers) in stats.stats.items():
+            if not callers:
+                stack_times[(func,)] += tottime
+                continue
+
+            for caller, (_, _, edge_tottime, _) in callers.items():
+                for stack, share in get_paths(stats.stats, caller, paths, set()):
+                    stack_times[(*stack, func)] += edge_tottime * share
+
+        self.write_stacks(stack_times, 1e6)
+
+    def write_sampling(self) -> None:
+        self.write_stacks(self.samples, 1)
+
+    def write_stacks(self, stacks: Counter, scale: float) -> None:
+        phase_weights = Counter()
+        with open(self.prefix.with_suffix(".collapsed"), "w") as file:
+            for stack, weight in stacks.most_common():
+                phase_weights[get_phase([func[2] for func in stack])] += weight
+                if (value := round(weight * scale)) > 0:
+                    file.write(";".join(get_label(*func) for func in stack) + f" {value}\n")
+
+        self.phases = get_shares(phase_weights)
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Profile sudoku solving.")
+    parser.add_argument("source", nargs="?", help="puzzle file or '-' for stdin, main.py's 9x9 puzzle by default")
+    parser.add_argument("--engine", choices=ENGINES, default="array")
+    parser.add_argument("--propagate", action="store_true")
+    parser.add_argument("--mode", choices=MODES, default="cprofile")
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--limit", type=int, help="profile at most this many puzzles")
+    parser.add_argument("--output", default="sudoku", help="prefix of the .pstats and .collapsed files")
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> int:
+    args = parse_args(args)
+    puzzles = read_puzzles(args.source) if args.source else [get_3_sudoku()]
+
+    statuses = Counter()
+    with Profiler(args.output, args.mode, args.interval) as profiler:
+        for count, result in enumerate(solve_many(puzzles, args.engine, args.propagate), 1):
+            statuses[result.status] += 1
+            if args.limit is not None and count >= args.limit:
+                break
+
+    json.dump({"statuses": statuses, "phases": profiler.phases}, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
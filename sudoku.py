@@ -1,17 +1,31 @@
+from collections.abc import Iterator
 from itertools import product
 
-from utils import DancingLinksList
+from utils import DancingLinksArray, DancingLinksList, SearchLimits, SearchStats, TimedOut
 
 
 class Sudoku:
-    def __init__(self, quad_dim: int = 3, field: list[list[int]] = None) -> None:
+    TECHNIQUES = ("none", "naked_single", "hidden_single", "intersection")
+
+    __templates = {}
+    __units = {}
+
+    def __init__(self, quad_dim: int = 3, field: list[list[int]] = None, engine: str = "list") -> None:
         if not isinstance(quad_dim, int):
             raise TypeError("Square dimension must be int.")
 
+        if engine not in ("list", "array"):
+            raise ValueError("Engine must be 'list' or 'array'.")
+
         self.__dim = quad_dim**2
         self.__quad_dim = quad_dim
+        self.__engine = engine
         self.__field = None
         self.__xfield = None
+        self.__is_xfield_synced = False
+        self.__xgivens = []
+        self.__technique = 0
+        self.__stats = None
 
         self.set_field(field)
 
@@ -46,28 +60,55 @@ class Sudoku:
         else:
             raise TypeError("Invalid type for coordinates")
 
-    def clear_xfield(self) -> None:
-        self.__xfield = DancingLinksList(len(str((self.__dim, self.__dim, self.__dim))) + 1)
+    def __fill_xfield(self, xfield: DancingLinksArray | DancingLinksList) -> None:
         for row, col, value in product(range(1, self.__dim + 1), repeat=3):
-            self.__xfield.set_row((row, col, value))
+            xfield.set_row((row, col, value))
 
         for k, i, j in product(range(4), range(1, self.__dim + 1), range(1, self.__dim + 1)):
-            self.__xfield.set_col((k, i, j))
+            xfield.set_col((k, i, j))
 
         for row, col in product(range(1, self.__dim + 1), repeat=2):
             quad = (row - 1) // self.__quad_dim * self.__quad_dim + (col - 1) // self.__quad_dim + 1
             for value in range(1, self.__dim + 1):
-                self.__xfield.set_node((row, col, value), (0, row, col))
-                self.__xfield.set_node((row, col, value), (1, row, value))
-                self.__xfield.set_node((row, col, value), (2, col, value))
-                self.__xfield.set_node((row, col, value), (3, quad, value))
+                xfield.set_node((row, col, value), (0, row, col))
+                xfield.set_node((row, col, value), (1, row, value))
+                xfield.set_node((row, col, value), (2, col, value))
+                xfield.set_node((row, col, value), (3, quad, value))
+
+    def __new_xfield(self) -> DancingLinksArray | DancingLinksList:
+        str_size = len(str((self.__dim, self.__dim, self.__dim))) + 1
+        if self.__engine == "list":
+            xfield = DancingLinksList(str_size)
+            self.__fill_xfield(xfield)
+            return xfield
+
+        if (template := Sudoku.__templates.get(self.__quad_dim)) is None:
+            template = DancingLinksArray(str_size)
+            self.__fill_xfield(template)
+            Sudoku.__templates[self.__quad_dim] = template
+
+        return template.copy()
+
+    def clear_xfield(self) -> None:
+        if self.__xfield is None or self.__engine == "array":
+            self.__xfield = self.__new_xfield()
+        else:
+            self.__xfield.reset()
+
+        self.__xgivens = []
+        self.__is_xfield_synced = False
+
+    def sync_xfield(self) -> None:
+        if self.__is_xfield_synced:
+            return None
+
+        self.clear_xfield()
+        self.field_to_xfield()
 
     def set_field(self, field: list[list[int]] | None) -> None:
         if field is None:
             self.__field = [[0 for _ in range(self.__dim)] for _ in range(self.__dim)]
-
-            self.clear_xfield()
-            self.field_to_xfield()
+            self.__is_xfield_synced = False
             return
 
         if len(field) != self.__dim:
@@ -81,23 +122,47 @@ class Sudoku:
             raise ValueError(f"Field values must be between 0 and {self.__dim}.")
 
         self.__field = field
-
-        self.clear_xfield()
-        self.field_to_xfield()
+        self.__is_xfield_synced = False
 
     def field_to_xfield(self) -> None:
         for row, col in product(range(self.__dim), repeat=2):
             if self.__field[row][col] > 0:
-                subset = self.__xfield.get_row((row + 1, col + 1, self.__field[row][col]))
-                self.__xfield.push_stack(subset)
-                self.__xfield.cover(subset)
+                self.__cover_given((row + 1, col + 1, self.__field[row][col]))
+
+        self.__is_xfield_synced = True
+
+    def __cover_given(self, given: tuple[int, int, int]) -> None:
+        subset = self.__xfield.get_row(given)
+        self.__xfield.push_stack(subset)
+        self.__xfield.cover(subset)
+        self.__xgivens.append(given)
+
+    def __uncover_given(self, given: tuple[int, int, int]) -> None:
+        self.__uncover_search()
+
+        pos = self.__xgivens.index(given)
+        for _ in range(len(self.__xgivens) - pos):
+            self.__xfield.uncover(self.__xfield.pop_stack())
+
+        covered_after = self.__xgivens[pos + 1 :]
+        del self.__xgivens[pos:]
+        for given in covered_after:
+            self.__cover_given(given)
+
+    def __uncover_search(self) -> None:
+        while len(self.__xfield.get_stack()) > len(self.__xgivens):
+            self.__xfield.uncover(self.__xfield.pop_stack())
 
     def xfield_to_field(self) -> None:
+        if not self.__is_xfield_synced:
+            return None
+
         field = [[0 for _ in range(self.__dim)] for _ in range(self.__dim)]
-        for cover_set in self.__xfield.get_stack():
-            field[cover_set.idx[0] - 1][cover_set.idx[1] - 1] = cover_set.idx[2]
+        for row, col, value in self.__xfield.get_stack_idxs():
+            field[row - 1][col - 1] = value
 
         self.__field = field
+        self.__xgivens = self.__xfield.get_stack_idxs()
 
     def get_field(self) -> list[list[int]]:
         return self.__field
@@ -134,12 +199,24 @@ class Sudoku:
         return True
 
     def set_ceil(self, row: int, col: int, value: int) -> bool:
-        if self.check_ceil(row, col, value):
-            self.__field[row - 1][col - 1] = value
-            return True
-        else:
+        if not self.check_ceil(row, col, value):
             return False
 
+        self.__place(row, col, value)
+        return True
+
+    def __place(self, row: int, col: int, value: int) -> None:
+        if self.__is_xfield_synced:
+            self.__uncover_search()
+
+            if (old_value := self.__field[row - 1][col - 1]) != 0:
+                self.__uncover_given((row, col, old_value))
+
+            if value != 0:
+                self.__cover_given((row, col, value))
+
+        self.__field[row - 1][col - 1] = value
+
     def get_ceil(self, row: int, col: int) -> int:
         if not all(isinstance(arg, int) for arg in (row, col)):
             raise TypeError("Row and col must be int.")
@@ -149,38 +226,357 @@ class Sudoku:
 
         return self.__field[row - 1][col - 1]
 
-    def solve(self, row: int = 1, col: int = 1) -> bool:
+    def solve(self, row: int = 1, col: int = 1, limits: SearchLimits | None = None) -> bool | TimedOut:
         if not all(isinstance(arg, int) for arg in (row, col)):
             raise TypeError("Row and col must be int.")
 
         if not all(1 <= arg <= self.__dim for arg in (row, col)):
             raise ValueError(f"Row and col must be between 1 and {self.__dim}")
 
-        next_col = col + 1
-        next_row = row
-        if next_col == self.__dim + 1:
-            next_col = 1
-            next_row = row + 1
+        start = (row - 1) * self.__dim + col - 1
+        cells = [divmod(k, self.__dim) for k in range(start, self.__dim**2)]
+        empty_cells = [(row + 1, col + 1) for row, col in cells if self.__field[row][col] == 0]
+
+        if empty_cells:
+            self.__is_xfield_synced = False
+
+        nodes = backtracks = 0
+        check_at = float("inf")
+        if limits is not None:
+            limits.start()
+            check_at = limits.get_next_check(0)
+
+        values = [0] * len(empty_cells)
+        pos = 0
+        while 0 <= pos < len(empty_cells):
+            if nodes >= check_at:
+                if limits.check(nodes):
+                    for row, col in empty_cells:
+                        self.__field[row - 1][col - 1] = 0
+                    return self.__timed_out(limits, nodes, backtracks)
+
+                check_at = limits.get_next_check(nodes)
+
+            row, col = empty_cells[pos]
+            self.__field[row - 1][col - 1] = 0
+
+            value = values[pos] + 1
+            while value <= self.__dim and not self.check_ceil(row, col, value):
+                value += 1
+
+            if value > self.__dim:
+                values[pos] = 0
+                pos -= 1
+                backtracks += 1
+            else:
+                self.__field[row - 1][col - 1] = value
+                values[pos] = value
+                pos += 1
+                nodes += 1
+
+        return pos == len(empty_cells)
+
+    def __get_units(self) -> tuple[list[list[int]], list[list[int]], list[tuple[list[int], list[int], list[int]]]]:
+        if (units := Sudoku.__units.get(self.__quad_dim)) is not None:
+            return units
+
+        dim, quad_dim = self.__dim, self.__quad_dim
+        rows = [[row * dim + col for col in range(dim)] for row in range(dim)]
+        cols = [[row * dim + col for row in range(dim)] for col in range(dim)]
+        quads = [
+            [(quad_row + i) * dim + quad_col + j for i, j in product(range(quad_dim), repeat=2)]
+            for quad_row, quad_col in product(range(0, dim, quad_dim), repeat=2)
+        ]
+
+        peers = []
+        for cell in range(dim**2):
+            row, col = divmod(cell, dim)
+            quad = row // quad_dim * quad_dim + col // quad_dim
+            peers.append(sorted((set(rows[row]) | set(cols[col]) | set(quads[quad])) - {cell}))
+
+        segments = []
+        for quad, line in product(quads, rows + cols):
+            if len(segment := [cell for cell in line if cell in quad]) > 1:
+                line_rest = [cell for cell in line if cell not in segment]
+                quad_rest = [cell for cell in quad if cell not in segment]
+                segments.append((segment, line_rest, quad_rest))
+
+        units = (rows + cols + quads, peers, segments)
+        Sudoku.__units[self.__quad_dim] = units
+        return units
+
+    def propagate(self) -> bool:
+        units, peers, segments = self.__get_units()
+        full_mask = (1 << self.__dim) - 1
+
+        values = [1 << (value - 1) if value else 0 for row in self.__field for value in row]
+        candidates = [0] * len(values)
+        for cell, bit in enumerate(values):
+            peers_mask = 0
+            for peer in peers[cell]:
+                peers_mask |= values[peer]
+
+            if bit & peers_mask:
+                return False
 
-        if self.__field[row - 1][col - 1] != 0:
-            if next_row == self.__dim + 1:
-                return True
-            return self.solve(next_row, next_col)
+            if bit == 0:
+                candidates[cell] = full_mask & ~peers_mask
+                if candidates[cell] == 0:
+                    return False
+
+        forced = []
+        technique = 0
+        while True:
+            singles = [(cell, mask) for cell, mask in enumerate(candidates) if mask and mask & (mask - 1) == 0]
+            if singles:
+                technique = max(technique, 1)
+            else:
+                for unit in units:
+                    once = twice = placed = 0
+                    for cell in unit:
+                        twice |= once & candidates[cell]
+                        once |= candidates[cell]
+                        placed |= values[cell]
+
+                    if once | placed != full_mask:
+                        return False
+
+                    hidden = once & ~twice
+                    while hidden:
+                        bit = hidden & -hidden
+                        hidden ^= bit
+                        singles.append((next(cell for cell in unit if candidates[cell] & bit), bit))
+
+                    if singles:
+                        technique = max(technique, 2)
+                        break
+
+            if singles:
+                for cell, bit in singles:
+                    if values[cell] or candidates[cell] & bit == 0:
+                        return False
+
+                    values[cell] = bit
+                    candidates[cell] = 0
+                    forced.append(cell)
+                    for peer in peers[cell]:
+                        if candidates[peer] & bit:
+                            candidates[peer] ^= bit
+                            if candidates[peer] == 0:
+                                return False
+                continue
+
+            is_reduced = False
+            for segment, line_rest, quad_rest in segments:
+                segment_mask = line_mask = quad_mask = 0
+                for cell in segment:
+                    segment_mask |= candidates[cell]
+                for cell in line_rest:
+                    line_mask |= candidates[cell]
+                for cell in quad_rest:
+                    quad_mask |= candidates[cell]
+
+                pointing = segment_mask & ~quad_mask & line_mask
+                box_line = segment_mask & ~line_mask & quad_mask
+                for cells, bits in ((line_rest, pointing), (quad_rest, box_line)):
+                    if bits == 0:
+                        continue
+
+                    is_reduced = True
+                    technique = 3
+                    for cell in cells:
+                        if candidates[cell] & bits:
+                            candidates[cell] &= ~bits
+                            if candidates[cell] == 0:
+                                return False
+
+            if not is_reduced:
+                break
+
+        for cell in forced:
+            row, col = divmod(cell, self.__dim)
+            self.__place(row + 1, col + 1, values[cell].bit_length())
+
+        self.__technique = technique
+        return True
 
-        for value in range(1, self.__dim + 1):
-            if self.set_ceil(row, col, value):
-                if next_row == self.__dim + 1:
-                    return True
+    def get_technique(self) -> str:
+        return Sudoku.TECHNIQUES[self.__technique]
 
-                if not self.solve(next_row, next_col):
-                    self.set_ceil(row, col, 0)
-                else:
-                    return True
+    def check_field(self) -> bool:
+        units, _, _ = self.__get_units()
+        values = [value for row in self.__field for value in row]
+        for unit in units:
+            unit_mask = 0
+            for cell in unit:
+                if values[cell] == 0:
+                    continue
 
-        return False
+                bit = 1 << (values[cell] - 1)
+                if unit_mask & bit:
+                    return False
+                unit_mask |= bit
+
+        return True
+
+    def is_filled(self) -> bool:
+        return all(value != 0 for row in self.__field for value in row)
+
+    @staticmethod
+    def __timed_out(limits: SearchLimits, nodes: int, backtracks: int) -> TimedOut:
+        stats = SearchStats()
+        stats.nodes = nodes
+        stats.backtracks = backtracks
+        return TimedOut(limits.reason, stats)
+
+    def __get_empty_cells(self) -> list[tuple[int, int]]:
+        return [(row, col) for row, col in product(range(self.__dim), repeat=2) if self.__field[row][col] == 0]
+
+    def __clear_cells(self, cells: list[tuple[int, int]]) -> None:
+        for row, col in cells:
+            if self.__field[row][col] != 0:
+                self.__place(row + 1, col + 1, 0)
+
+    def bsolve(self, propagate: bool = False, limits: SearchLimits | None = None) -> bool | TimedOut:
+        if limits is not None:
+            limits.start()
+
+        start_cells = self.__get_empty_cells() if propagate else []
+        if propagate and not self.propagate():
+            return False
+
+        full_mask = (1 << self.__dim) - 1
+        row_masks = [0] * self.__dim
+        col_masks = [0] * self.__dim
+        quad_masks = [0] * self.__dim
+
+        empty_cells = []
+        for row, col in product(range(self.__dim), repeat=2):
+            quad = row // self.__quad_dim * self.__quad_dim + col // self.__quad_dim
+            if (value := self.__field[row][col]) == 0:
+                empty_cells.append((row, col, quad))
+                continue
+
+            bit = 1 << (value - 1)
+            if (row_masks[row] | col_masks[col] | quad_masks[quad]) & bit:
+                self.__clear_cells(start_cells)
+                return False
+
+            row_masks[row] |= bit
+            col_masks[col] |= bit
+            quad_masks[quad] |= bit
+
+        nodes = backtracks = 0
+        check_at = float("inf") if limits is None else limits.get_next_check(0)
+
+        length = len(empty_cells)
+        candidates = [0] * length
+        placed = [0] * length
+        depth = 0
+        while depth < length:
+            if nodes >= check_at:
+                if limits.check(nodes):
+                    self.__clear_cells(start_cells)
+                    return self.__timed_out(limits, nodes, backtracks)
+
+                check_at = limits.get_next_check(nodes)
+
+            best_pos = depth
+            best_mask = 0
+            best_count = self.__dim + 1
+            for pos in range(depth, length):
+                row, col, quad = empty_cells[pos]
+                mask = full_mask & ~(row_masks[row] | col_masks[col] | quad_masks[quad])
+                if (count := mask.bit_count()) < best_count:
+                    best_pos, best_mask, best_count = pos, mask, count
+                    if count <= 1:
+                        break
+
+            empty_cells[depth], empty_cells[best_pos] = empty_cells[best_pos], empty_cells[depth]
+            candidates[depth] = best_mask
+
+            if candidates[depth] == 0:
+                backtracks += 1
+
+            while (mask := candidates[depth]) == 0:
+                depth -= 1
+                if depth < 0:
+                    self.__clear_cells(start_cells)
+                    return False
+
+                row, col, quad = empty_cells[depth]
+                bit = placed[depth]
+                row_masks[row] ^= bit
+                col_masks[col] ^= bit
+                quad_masks[quad] ^= bit
+
+            bit = mask & -mask
+            candidates[depth] = mask ^ bit
+            placed[depth] = bit
+
+            row, col, quad = empty_cells[depth]
+            row_masks[row] |= bit
+            col_masks[col] |= bit
+            quad_masks[quad] |= bit
+            depth += 1
+            nodes += 1
+
+        for (row, col, _), bit in zip(empty_cells, placed):
+            self.__field[row][col] = bit.bit_length()
+
+        if empty_cells:
+            self.__is_xfield_synced = False
 
-    def xsolve(self) -> bool:
-        if self.__xfield.algorithm_x():
+        return True
+
+    def xsolve(
+        self, propagate: bool = False, instrument: bool = False, limits: SearchLimits | None = None
+    ) -> bool | TimedOut:
+        self.__stats = SearchStats() if instrument or limits is not None else None
+        if limits is not None:
+            limits.start()
+
+        start_cells = self.__get_empty_cells() if propagate else []
+        if propagate:
+            if not self.propagate():
+                return False
+
+            if self.is_filled():
+                return True
+
+        self.sync_xfield()
+
+        if self.__xfield.algorithm_x(stats=self.__stats, limits=limits):
             return True
 
+        self.__clear_cells(start_cells)
+        if limits is not None and limits.reason is not None:
+            return TimedOut(limits.reason, self.__stats)
+
         return False
+
+    def get_stats(self) -> SearchStats | None:
+        return self.__stats
+
+    def get_branches(self) -> list[tuple[int, int, int]] | None:
+        self.sync_xfield()
+        self.__uncover_search()
+
+        return self.__xfield.get_min_col_idxs()
+
+    def count_solutions(self, limit: int | None = None) -> int:
+        self.sync_xfield()
+        self.__uncover_search()
+
+        return self.__xfield.count_solutions(limit)
+
+    def iter_solutions(self) -> Iterator[list[list[int]]]:
+        self.sync_xfield()
+        self.__uncover_search()
+
+        for cover_sets in self.__xfield.iter_solutions():
+            field = [[0 for _ in range(self.__dim)] for _ in range(self.__dim)]
+            for row, col, value in cover_sets:
+                field[row - 1][col - 1] = value
+
+            yield field
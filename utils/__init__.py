@@ -1,4 +1,15 @@
+from .dancing_links_array import DancingLinksArray
 from .dancing_links_list import DancingLinksList
 from .ring_linked_list import RingLinkedList
+from .search_limits import CancellationToken, SearchLimits, TimedOut
+from .search_stats import SearchStats
 
-__all__ = ["DancingLinksList", "RingLinkedList"]
+__all__ = [
+    "CancellationToken",
+    "DancingLinksArray",
+    "DancingLinksList",
+    "RingLinkedList",
+    "SearchLimits",
+    "SearchStats",
+    "TimedOut",
+]
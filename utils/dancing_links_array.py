@@ -0,0 +1,520 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .search_limits import SearchLimits
+    from .search_stats import SearchStats
+
+
+class DancingLinksArray:
+    def __init__(self, str_size: int = 3) -> None:
+        self.left = array("i", [0])
+        self.right = array("i", [0])
+        self.up = array("i", [0])
+        self.down = array("i", [0])
+        self.col = array("i", [0])
+        self.row = array("i", [-1])
+        self.size = array("i", [0])
+
+        self.row_first = array("i")
+        self.row_idxs = []
+        self.row_index = {}
+
+        self.col_idxs = {}
+        self.col_index = {}
+
+        self.stack = []
+        self.str_size = str_size
+
+    def __repr__(self) -> str:
+        return (
+            f"DancingLinksArray(row_length={len(self.row_idxs)}, col_length={len(self.col_idxs)}, "
+            f"node_length={len(self.col) - 1})"
+        )
+
+    def __str__(self) -> str:
+        row_sep = "-" * self.str_size
+        cols = []
+        col = self.right[0]
+        while col != 0:
+            cols.append(col)
+            col = self.right[col]
+
+        result_str = f"|{row_sep * 2}|" + f"{row_sep}|" * len(cols) + "\n"
+        result_str += f"|{' ' * self.str_size * 2}|"
+        result_str += "".join(f"{str(self.col_idxs[col]):>{self.str_size}}|" for col in cols) + "\n"
+        result_str += f"|{' ' * self.str_size * 2}|"
+        result_str += "".join(f"{self.size[col]:>{self.str_size}}|" for col in cols) + "\n"
+        result_str += f"|{row_sep * 2}|" + f"{row_sep}|" * len(cols) + "\n"
+
+        for row in range(len(self.row_idxs)):
+            if not self.is_row_alive(row):
+                continue
+
+            row_cols = set(self.get_cols_cross_row(row))
+            result_str += f"|{str(self.row_idxs[row]):>{self.str_size * 2}}|"
+            result_str += "".join(f"{int(col in row_cols):>{self.str_size}}|" for col in cols) + "\n"
+
+        result_str += f"|{row_sep * 2}|" + f"{row_sep}|" * len(cols) + "\n"
+        return result_str
+
+    def get_cols_cross_row(self, row: int) -> list[int]:
+        cols = []
+        if (first := self.row_first[row]) == -1:
+            return cols
+
+        node = first
+        while True:
+            cols.append(self.col[node])
+            node = self.right[node]
+            if node == first:
+                break
+
+        return cols
+
+    def get_rows_cross_col(self, col: int) -> list[int]:
+        rows = []
+        node = self.down[col]
+        while node != col:
+            rows.append(self.row[node])
+            node = self.down[node]
+
+        return rows
+
+    def is_row_alive(self, row: int) -> bool:
+        for col in self.get_cols_cross_row(row):
+            if self.right[self.left[col]] != col:
+                return False
+
+        return True
+
+    def get_row(self, idx: int | tuple) -> int:
+        if (row := self.row_index.get(idx)) is None:
+            raise IndexError("Row not found")
+
+        if not self.is_row_alive(row):
+            raise IndexError("Row not found")
+
+        return row
+
+    def set_row(self, idx: int | tuple) -> None:
+        if idx in self.row_index:
+            raise ValueError("Node already exists")
+
+        self.row_index[idx] = len(self.row_idxs)
+        self.row_idxs.append(idx)
+        self.row_first.append(-1)
+
+    def get_col(self, idx: int | tuple) -> int:
+        if (col := self.col_index.get(idx)) is None:
+            raise IndexError("Column not found")
+
+        if self.right[self.left[col]] != col:
+            raise IndexError("Column not found")
+
+        return col
+
+    def set_col(self, idx: int | tuple) -> None:
+        if idx in self.col_index:
+            raise ValueError("Node already exists")
+
+        col = len(self.col)
+        self.left.append(self.left[0])
+        self.right.append(0)
+        self.up.append(col)
+        self.down.append(col)
+        self.col.append(col)
+        self.row.append(-1)
+        self.size.append(0)
+
+        self.right[self.left[0]] = col
+        self.left[0] = col
+
+        self.col_index[idx] = col
+        self.col_idxs[col] = idx
+
+    def set_node(self, row_idx: int | tuple, col_idx: int | tuple) -> None:
+        if (row := self.row_index.get(row_idx)) is None:
+            raise IndexError("Row not found")
+
+        if (col := self.col_index.get(col_idx)) is None:
+            raise IndexError("Column not found")
+
+        node = len(self.col)
+        self.up.append(self.up[col])
+        self.down.append(col)
+        self.col.append(col)
+        self.row.append(row)
+        self.size.append(0)
+
+        self.down[self.up[col]] = node
+        self.up[col] = node
+        self.size[col] += 1
+
+        if (first := self.row_first[row]) == -1:
+            self.left.append(node)
+            self.right.append(node)
+            self.row_first[row] = node
+        else:
+            self.left.append(self.left[first])
+            self.right.append(first)
+            self.right[self.left[first]] = node
+            self.left[first] = node
+
+    def get_min_col_length(self) -> int:
+        right = self.right
+        size = self.size
+
+        col = right[0]
+        if col == 0:
+            raise IndexError("Column list is empty")
+
+        min_col = col
+        min_size = size[col]
+        while col != 0 and min_size > 1:
+            if size[col] < min_size:
+                min_col = col
+                min_size = size[col]
+            col = right[col]
+
+        return min_col
+
+    def get_min_col_idxs(self) -> list[int | tuple] | None:
+        if self.right[0] == 0:
+            return None
+
+        return [self.row_idxs[row] for row in self.get_rows_cross_col(self.get_min_col_length())]
+
+    def set_list_matrix(self, matrix: list[list[int]]) -> None:
+        if (rows_length := len(matrix)) == 0:
+            raise ValueError("Matrix is empty")
+
+        if (cols_length := len(matrix[0])) == 0:
+            raise ValueError("Matrix is empty")
+
+        for i in range(rows_length):
+            if len(matrix[i]) != cols_length:
+                raise ValueError("Matrix is not rectangular")
+
+        for i in range(rows_length):
+            self.set_row(i)
+
+        for j in range(cols_length):
+            self.set_col(j)
+
+        for i in range(rows_length):
+            for j in range(cols_length):
+                if matrix[i][j]:
+                    self.set_node(i, j)
+
+    def set_dict_matrix(self, matrix: dict[tuple, dict[tuple, int]]) -> None:
+        if len(matrix) == 0:
+            raise ValueError("Matrix is empty")
+
+        cols = matrix[list(matrix.keys())[0]]
+        if len(cols) == 0:
+            raise ValueError("Matrix is empty")
+
+        for row in matrix:
+            if len(matrix[row]) != len(cols):
+                raise ValueError("Matrix is not rectangular")
+
+        for row in matrix:
+            self.set_row(row)
+
+        for col in cols:
+            self.set_col(col)
+
+        for row in matrix:
+            for col in cols:
+                if matrix[row][col]:
+                    self.set_node(row, col)
+
+    def push_stack(self, subset: int) -> None:
+        self.stack.append(subset)
+
+    def pop_stack(self) -> int:
+        return self.stack.pop()
+
+    def refresh_stack(self) -> None:
+        self.stack = []
+
+    def get_stack(self) -> list[int]:
+        return self.stack
+
+    def get_stack_idxs(self) -> list[int | tuple]:
+        return [self.row_idxs[row] for row in self.stack]
+
+    def reset(self) -> None:
+        while self.stack:
+            self.uncover(self.stack.pop())
+
+    def copy(self) -> DancingLinksArray:
+        xfield = DancingLinksArray(self.str_size)
+        xfield.left = self.left[:]
+        xfield.right = self.right[:]
+        xfield.up = self.up[:]
+        xfield.down = self.down[:]
+        xfield.col = self.col[:]
+        xfield.row = self.row[:]
+        xfield.size = self.size[:]
+
+        xfield.row_first = self.row_first[:]
+        xfield.row_idxs = self.row_idxs[:]
+        xfield.row_index = self.row_index.copy()
+
+        xfield.col_idxs = self.col_idxs.copy()
+        xfield.col_index = self.col_index.copy()
+
+        xfield.stack = self.stack[:]
+        return xfield
+
+    def cover_col(self, col: int) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        node_col, size = self.col, self.size
+
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                up[down[j]] = up[j]
+                down[up[j]] = down[j]
+                size[node_col[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover_col(self, col: int) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        node_col, size = self.col, self.size
+
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[node_col[j]] += 1
+                up[down[j]] = j
+                down[up[j]] = j
+                j = left[j]
+            i = up[i]
+
+        right[left[col]] = col
+        left[right[col]] = col
+
+    def cover(self, row: int) -> None:
+        if (first := self.row_first[row]) == -1:
+            return None
+
+        node = first
+        while True:
+            self.cover_col(self.col[node])
+            node = self.right[node]
+            if node == first:
+                break
+
+    def uncover(self, row: int) -> None:
+        if (first := self.row_first[row]) == -1:
+            return None
+
+        node = self.left[first]
+        while True:
+            self.uncover_col(self.col[node])
+            if node == first:
+                break
+            node = self.left[node]
+
+    def get_row_length(self, row: int) -> int:
+        return len(self.get_cols_cross_row(row))
+
+    def algorithm_x(
+        self, mrv: bool = True, stats: SearchStats | None = None, limits: SearchLimits | None = None
+    ) -> list | None:
+        if not mrv:
+            raise ValueError("Array engine only searches with MRV")
+
+        if limits is not None and stats is None:
+            raise ValueError("Search limits need a stats object")
+
+        if stats is not None:
+            return self.algorithm_x_stats(stats, limits)
+
+        right, down, node_row = self.right, self.down, self.row
+
+        frames = []
+        while True:
+            if right[0] == 0:
+                return self.stack
+
+            col = self.get_min_col_length()
+            if (node := down[col]) != col:
+                row = node_row[node]
+                self.stack.append(row)
+                self.cover(row)
+                frames.append((col, node))
+                continue
+
+            while frames:
+                col, node = frames.pop()
+                self.uncover(self.stack.pop())
+
+                if (node := down[node]) != col:
+                    row = node_row[node]
+                    self.stack.append(row)
+                    self.cover(row)
+                    frames.append((col, node))
+                    break
+            else:
+                return None
+
+    def algorithm_x_stats(self, stats: SearchStats, limits: SearchLimits | None = None) -> list | None:
+        right, down, node_row, size = self.right, self.down, self.row, self.size
+        base_length = len(self.stack)
+        check_at = float("inf") if limits is None else limits.get_next_check(stats.nodes)
+
+        frames = []
+        while True:
+            if right[0] == 0:
+                return self.stack
+
+            if stats.nodes >= check_at:
+                if limits.check(stats.nodes):
+                    while len(self.stack) > base_length:
+                        self.uncover(self.stack.pop())
+                    return None
+
+                check_at = limits.get_next_check(stats.nodes)
+
+            col = self.get_min_col_length()
+            stats.add_branch(len(frames), size[col])
+            if (node := down[col]) != col:
+                row = node_row[node]
+                self.stack.append(row)
+                self.cover(row)
+                frames.append((col, node))
+                stats.add_node(len(frames), self.col_idxs[col], self.get_row_length(row))
+                continue
+
+            while frames:
+                col, node = frames.pop()
+                row = self.stack.pop()
+                self.uncover(row)
+                stats.uncovers += self.get_row_length(row)
+
+                if (node := down[node]) != col:
+                    row = node_row[node]
+                    self.stack.append(row)
+                    self.cover(row)
+                    frames.append((col, node))
+                    stats.add_node(len(frames), self.col_idxs[col], self.get_row_length(row))
+                    break
+            else:
+                return None
+
+    def count_solutions(self, limit: int | None = None) -> int:
+        if limit is not None and limit < 1:
+            raise ValueError("Limit must be positive.")
+
+        right, down, node_row = self.right, self.down, self.row
+        base_length = len(self.stack)
+        count = 0
+
+        frames = []
+        while True:
+            if right[0] == 0:
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+            elif (node := down[col := self.get_min_col_length()]) != col:
+                row = node_row[node]
+                self.stack.append(row)
+                self.cover(row)
+                frames.append((col, node))
+                continue
+
+            while frames:
+                col, node = frames.pop()
+                self.uncover(self.stack.pop())
+
+                if (node := down[node]) != col:
+                    row = node_row[node]
+                    self.stack.append(row)
+                    self.cover(row)
+                    frames.append((col, node))
+                    break
+            else:
+                break
+
+        while len(self.stack) > base_length:
+            self.uncover(self.stack.pop())
+
+        return count
+
+    def iter_solutions(self) -> Iterator[tuple]:
+        right, down, node_row = self.right, self.down, self.row
+        base_length = len(self.stack)
+
+        frames = []
+        try:
+            while True:
+                if right[0] == 0:
+                    yield tuple(self.get_stack_idxs())
+                elif (node := down[col := self.get_min_col_length()]) != col:
+                    row = node_row[node]
+                    self.stack.append(row)
+                    self.cover(row)
+                    frames.append((col, node))
+                    continue
+
+                while frames:
+                    col, node = frames.pop()
+                    self.uncover(self.stack.pop())
+
+                    if (node := down[node]) != col:
+                        row = node_row[node]
+                        self.stack.append(row)
+                        self.cover(row)
+                        frames.append((col, node))
+                        break
+                else:
+                    return None
+        finally:
+            while len(self.stack) > base_length:
+                self.uncover(self.stack.pop())
+
+
+def test() -> None:
+    dancing_links_array = DancingLinksArray()
+    list_matrix = [
+        [0, 0, 1, 0, 1, 1, 0],
+        [1, 0, 0, 1, 0, 0, 1],
+        [0, 1, 1, 0, 0, 1, 0],
+        [1, 0, 0, 1, 0, 0, 0],
+        [0, 1, 0, 0, 0, 0, 1],
+        [0, 0, 0, 1, 1, 0, 1],
+    ]
+    dancing_links_array.set_list_matrix(list_matrix)
+
+    print(repr(dancing_links_array))
+    print(dancing_links_array)
+
+    row = dancing_links_array.get_row(2)
+    dancing_links_array.cover(row)
+
+    print(dancing_links_array)
+
+    dancing_links_array.uncover(row)
+
+    print(dancing_links_array)
+
+    if dancing_links_array.algorithm_x():
+        print(dancing_links_array.get_stack_idxs())
+    else:
+        print("No solve", dancing_links_array.get_stack_idxs())
+
+
+if __name__ == "__main__":
+    test()
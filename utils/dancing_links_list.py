@@ -1,5 +1,11 @@
 from __future__ import annotations
+from collections.abc import Iterator
 from functools import total_ordering
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .search_limits import SearchLimits
+    from .search_stats import SearchStats
 
 
 class Node:
@@ -214,6 +220,7 @@ class ColNode:
         self.tail = None
         self.length = 0
         self.idx = idx
+        self.bucket = None
 
     def __repr__(self) -> str:
         if self.length == 0:
@@ -394,10 +401,13 @@ class DancingLinksList:
         self.row_head = None
         self.row_tail = None
         self.row_length = 0
+        self.row_index = {}
 
         self.col_head = None
         self.col_tail = None
         self.col_length = 0
+        self.col_index = {}
+        self.col_buckets = []
 
         self.stack = []
         self.str_size = str_size
@@ -531,23 +541,15 @@ class DancingLinksList:
         if self.row_length == 0:
             raise IndexError("Row list is empty")
 
-        if idx < self.row_head or idx > self.row_tail:
-            raise IndexError("Row index out of range")
+        if (row_node := self.row_index.get(idx)) is None:
+            raise IndexError("Row not found")
 
-        row_node = self.row_head
-        while True:
-            if row_node == idx:
-                return row_node
-
-            if row_node is self.row_tail:
-                break
-            row_node = row_node.down
-
-        raise IndexError("Row not found")
+        return row_node
 
     def del_row(self, idx: int | tuple) -> RowNode:
         row_node = self.get_row(idx)
         row_node.del_row()
+        self.rebucket_cols_cross_row(row_node)
 
         if self.row_length == 1:
             self.row_head = None
@@ -557,10 +559,14 @@ class DancingLinksList:
         elif row_node is self.row_tail:
             self.row_tail = row_node.up
 
+        del self.row_index[row_node.idx]
         self.row_length -= 1
         return row_node
 
     def set_row(self, idx: int | tuple) -> None:
+        if idx in self.row_index:
+            raise ValueError("Node already exists")
+
         if self.row_length == 0:
             new_row_node = RowNode(idx)
             new_row_node.up = new_row_node
@@ -568,6 +574,7 @@ class DancingLinksList:
 
             self.row_head = new_row_node
             self.row_tail = new_row_node
+            self.row_index[idx] = new_row_node
             self.row_length += 1
             return
 
@@ -581,6 +588,7 @@ class DancingLinksList:
             elif idx > self.row_tail:
                 self.row_tail = new_row_node
 
+            self.row_index[idx] = new_row_node
             self.row_length += 1
             return
 
@@ -597,6 +605,7 @@ class DancingLinksList:
                 row_node.down.up = new_row_node
                 row_node.down = new_row_node
 
+                self.row_index[idx] = new_row_node
                 self.row_length += 1
                 return
 
@@ -604,6 +613,7 @@ class DancingLinksList:
 
     def restore_row(self, row_node: RowNode) -> None:
         row_node.restore_row()
+        self.rebucket_cols_cross_row(row_node)
 
         if self.row_length == 0:
             self.row_head = row_node
@@ -613,29 +623,22 @@ class DancingLinksList:
         elif row_node > self.row_tail:
             self.row_tail = row_node
 
+        self.row_index[row_node.idx] = row_node
         self.row_length += 1
 
     def get_col(self, idx: int | tuple) -> ColNode:
         if self.col_length == 0:
             raise IndexError("Column list is empty")
 
-        if idx < self.col_head or idx > self.col_tail:
-            raise IndexError("Column index out of range")
-
-        col_node = self.col_head
-        while True:
-            if col_node == idx:
-                return col_node
-
-            if col_node is self.col_tail:
-                break
-            col_node = col_node.right
+        if (col_node := self.col_index.get(idx)) is None:
+            raise IndexError("Column not found")
 
-        raise IndexError("Column not found")
+        return col_node
 
     def del_col(self, idx: int | tuple) -> ColNode:
         col_node = self.get_col(idx)
         col_node.del_col()
+        self.unbucket_col(col_node)
 
         if self.col_length == 1:
             self.col_head = None
@@ -645,10 +648,14 @@ class DancingLinksList:
         elif col_node is self.col_tail:
             self.col_tail = col_node.left
 
+        del self.col_index[col_node.idx]
         self.col_length -= 1
         return col_node
 
     def set_col(self, idx: int | tuple) -> None:
+        if idx in self.col_index:
+            raise ValueError("Node already exists")
+
         if self.col_length == 0:
             new_col_node = ColNode(idx)
             new_col_node.left = new_col_node
@@ -656,6 +663,8 @@ class DancingLinksList:
 
             self.col_head = new_col_node
             self.col_tail = new_col_node
+            self.col_index[idx] = new_col_node
+            self.bucket_col(new_col_node)
             self.col_length += 1
             return
 
@@ -669,6 +678,8 @@ class DancingLinksList:
             elif idx > self.col_tail:
                 self.col_tail = new_col_node
 
+            self.col_index[idx] = new_col_node
+            self.bucket_col(new_col_node)
             self.col_length += 1
             return
 
@@ -685,6 +696,8 @@ class DancingLinksList:
                 col_node.right.left = new_col_node
                 col_node.right = new_col_node
 
+                self.col_index[idx] = new_col_node
+                self.bucket_col(new_col_node)
                 self.col_length += 1
                 return
 
@@ -692,6 +705,7 @@ class DancingLinksList:
 
     def restore_col(self, col_node: ColNode) -> None:
         col_node.restore_col()
+        self.bucket_col(col_node)
 
         if self.col_length == 0:
             self.col_head = col_node
@@ -701,6 +715,7 @@ class DancingLinksList:
         elif col_node > self.col_tail:
             self.col_tail = col_node
 
+        self.col_index[col_node.idx] = col_node
         self.col_length += 1
 
     def get_node(self, row_idx: int | tuple, col_idx: int | tuple) -> Node:
@@ -721,6 +736,7 @@ class DancingLinksList:
         if node is col_node[row_idx]:
             del row_node[col_idx]
             del col_node[row_idx]
+            self.rebucket_col(col_node)
             return
 
         raise IndexError("Node not found")
@@ -732,6 +748,39 @@ class DancingLinksList:
         node = Node(row_node, col_node)
         row_node[col_idx] = node
         col_node[row_idx] = node
+        self.rebucket_col(col_node)
+
+    def bucket_col(self, col_node: ColNode) -> None:
+        while len(self.col_buckets) <= col_node.length:
+            self.col_buckets.append({})
+
+        self.col_buckets[col_node.length][id(col_node)] = col_node
+        col_node.bucket = col_node.length
+
+    def unbucket_col(self, col_node: ColNode) -> None:
+        if col_node.bucket is None:
+            return None
+
+        del self.col_buckets[col_node.bucket][id(col_node)]
+        col_node.bucket = None
+
+    def rebucket_col(self, col_node: ColNode) -> None:
+        if col_node.bucket is None or col_node.bucket == col_node.length:
+            return None
+
+        self.unbucket_col(col_node)
+        self.bucket_col(col_node)
+
+    def rebucket_cols_cross_row(self, row_node: RowNode) -> None:
+        if row_node.length == 0:
+            return None
+
+        node = row_node.head
+        while True:
+            self.rebucket_col(node.col)
+            if node is row_node.tail:
+                break
+            node = node.right
 
     def get_min_row_length(self) -> RowNode:
         if self.row_length == 0:
@@ -753,17 +802,17 @@ class DancingLinksList:
         if self.col_length == 0:
             raise IndexError("Column list is empty")
 
-        col_node = self.col_head
-        min_column = col_node
-        while True:
-            if col_node.length < min_column.length:
-                min_column = col_node
+        for bucket in self.col_buckets:
+            if bucket:
+                return next(iter(bucket.values()))
 
-            if col_node is self.col_tail:
-                break
-            col_node = col_node.right
+        raise IndexError("Column not found")
+
+    def get_min_col_idxs(self) -> list[int | tuple] | None:
+        if self.col_length == 0:
+            return None
 
-        return min_column
+        return [row.idx for row in self.get_rows_cross_col(self.get_min_col_length())]
 
     def get_sorted_rows(self) -> list[RowNode]:
         rows = []
@@ -841,68 +890,334 @@ class DancingLinksList:
     def push_stack(self, subset: RowNode) -> None:
         self.stack.append(subset)
 
+    def pop_stack(self) -> RowNode:
+        return self.stack.pop()
+
     def refresh_stack(self) -> None:
         self.stack = []
 
     def get_stack(self) -> list[RowNode]:
         return self.stack
 
-    def cover(self, row: RowNode) -> tuple[list[ColNode], list[RowNode]]:
-        del_cols = []
-        del_rows = []
+    def get_stack_idxs(self) -> list[int | tuple]:
+        return [row.idx for row in self.stack]
 
-        node = row.head
-        while row.length > 0:
-            result = self.del_col(node.col.idx)
-            del_cols.append(result)
-            node = node.right
+    def reset(self) -> None:
+        while self.stack:
+            self.uncover(self.stack.pop())
 
-        for del_col in del_cols:
-            node = del_col.head
-            while True:
-                if node.row not in del_rows:
-                    result = self.del_row(node.row.idx)
-                    del_rows.append(result)
+    def cover_col(self, col_node: ColNode) -> None:
+        col_node.left.right = col_node.right
+        col_node.right.left = col_node.left
 
-                if node is del_col.tail:
-                    break
-                node = node.down
+        if self.col_length == 1:
+            self.col_head = None
+            self.col_tail = None
+        elif col_node is self.col_head:
+            self.col_head = col_node.right
+        elif col_node is self.col_tail:
+            self.col_tail = col_node.left
+
+        del self.col_index[col_node.idx]
+        self.col_length -= 1
+        self.unbucket_col(col_node)
+
+        if col_node.length == 0:
+            return None
 
-        return del_cols, del_rows
+        buckets = self.col_buckets
+        node = col_node.head
+        while True:
+            row_node = node.row
+            row_node.up.down = row_node.down
+            row_node.down.up = row_node.up
+
+            if self.row_length == 1:
+                self.row_head = None
+                self.row_tail = None
+            elif row_node is self.row_head:
+                self.row_head = row_node.down
+            elif row_node is self.row_tail:
+                self.row_tail = row_node.up
+
+            del self.row_index[row_node.idx]
+            self.row_length -= 1
+
+            other = node.right
+            while other is not node:
+                col = other.col
+                other.up.down = other.down
+                other.down.up = other.up
+
+                if col.length == 1:
+                    col.head = None
+                    col.tail = None
+                elif other is col.head:
+                    col.head = other.down
+                elif other is col.tail:
+                    col.tail = other.up
+
+                del buckets[col.length][id(col)]
+                col.length -= 1
+                buckets[col.length][id(col)] = col
+                col.bucket = col.length
+                other = other.right
 
-    def uncover(self, del_cols: list[ColNode], del_rows: list[RowNode]) -> None:
-        for del_row in del_rows[::-1]:
-            self.restore_row(del_row)
+            if node is col_node.tail:
+                break
+            node = node.down
 
-        for del_col in del_cols[::-1]:
-            self.restore_col(del_col)
+    def uncover_col(self, col_node: ColNode) -> None:
+        buckets = self.col_buckets
+        node = col_node.tail
+        while col_node.length > 0:
+            row_node = node.row
+            other = node.left
+            while other is not node:
+                col = other.col
+                other.up.down = other
+                other.down.up = other
+
+                if col.length == 0:
+                    col.head = other
+                    col.tail = other
+                elif other.down is col.head and other.row.idx < col.head.row.idx:
+                    col.head = other
+                elif other.up is col.tail and other.row.idx > col.tail.row.idx:
+                    col.tail = other
+
+                del buckets[col.length][id(col)]
+                col.length += 1
+                buckets[col.length][id(col)] = col
+                col.bucket = col.length
+                other = other.left
+
+            row_node.up.down = row_node
+            row_node.down.up = row_node
+
+            if self.row_length == 0:
+                self.row_head = row_node
+                self.row_tail = row_node
+            elif row_node.down is self.row_head and row_node.idx < self.row_head.idx:
+                self.row_head = row_node
+            elif row_node.up is self.row_tail and row_node.idx > self.row_tail.idx:
+                self.row_tail = row_node
+
+            self.row_index[row_node.idx] = row_node
+            self.row_length += 1
 
-    def algorithm_x(self) -> list | None:
-        # if (stack_length := len(self.stack)) > 600:
-        #     print(stack_length)
+            if node is col_node.head:
+                break
+            node = node.up
+
+        col_node.left.right = col_node
+        col_node.right.left = col_node
 
         if self.col_length == 0:
-            return self.stack
+            self.col_head = col_node
+            self.col_tail = col_node
+        elif col_node.right is self.col_head and col_node.idx < self.col_head.idx:
+            self.col_head = col_node
+        elif col_node.left is self.col_tail and col_node.idx > self.col_tail.idx:
+            self.col_tail = col_node
 
-        if self.row_length == 0:
+        self.col_index[col_node.idx] = col_node
+        self.col_length += 1
+        self.bucket_col(col_node)
+
+    def cover(self, row: RowNode) -> None:
+        if row.length == 0:
             return None
 
-        column_list = self.get_sorted_cols()
-        # column_list = [self.get_min_col_length()]
-        for column in column_list:
-            if not (rows := self.get_rows_cross_col(column)):
+        node = row.head
+        while True:
+            self.cover_col(node.col)
+            if node is row.tail:
+                break
+            node = node.right
+
+    def uncover(self, row: RowNode) -> None:
+        if row.length == 0:
+            return None
+
+        node = row.tail
+        while True:
+            self.uncover_col(node.col)
+            if node is row.head:
+                break
+            node = node.left
+
+    def algorithm_x(
+        self, mrv: bool = True, stats: SearchStats | None = None, limits: SearchLimits | None = None
+    ) -> list | None:
+        if limits is not None and stats is None:
+            raise ValueError("Search limits need a stats object")
+
+        if stats is not None:
+            if not mrv:
+                raise ValueError("Search stats are only collected with MRV")
+
+            return self.algorithm_x_stats(stats, limits)
+
+        frames = []
+        while True:
+            if self.col_length == 0:
+                return self.stack
+
+            if self.row_length != 0:
+                if mrv:
+                    column_list = [self.get_min_col_length()]
+                else:
+                    column_list = self.get_sorted_cols()
+
+                frames.append([column_list, -1, None])
+
+            while frames:
+                frame = frames[-1]
+                column_list, col_pos, node = frame
+
+                if node is not None:
+                    self.uncover(self.stack.pop())
+                    node = None if node is column_list[col_pos].tail else node.down
+
+                if node is None:
+                    col_pos += 1
+                    if col_pos == len(column_list) or column_list[col_pos].length == 0:
+                        frames.pop()
+                        continue
+                    node = column_list[col_pos].head
+
+                self.stack.append(node.row)
+                self.cover(node.row)
+                frame[1] = col_pos
+                frame[2] = node
+                break
+            else:
+                return None
+
+    def algorithm_x_stats(self, stats: SearchStats, limits: SearchLimits | None = None) -> list | None:
+        base_length = len(self.stack)
+        check_at = float("inf") if limits is None else limits.get_next_check(stats.nodes)
+
+        frames = []
+        while True:
+            if self.col_length == 0:
+                return self.stack
+
+            if stats.nodes >= check_at:
+                if limits.check(stats.nodes):
+                    while len(self.stack) > base_length:
+                        self.uncover(self.stack.pop())
+                    return None
+
+                check_at = limits.get_next_check(stats.nodes)
+
+            column = self.get_min_col_length()
+            stats.add_branch(len(frames), column.length)
+            if column.length != 0:
+                node = column.head
+                self.stack.append(node.row)
+                self.cover(node.row)
+                frames.append([column, node])
+                stats.add_node(len(frames), column.idx, node.row.length)
+                continue
+
+            while frames:
+                frame = frames[-1]
+                column, node = frame
+                row = self.stack.pop()
+                self.uncover(row)
+                stats.uncovers += row.length
+
+                if node is column.tail:
+                    frames.pop()
+                    continue
+
+                node = node.down
+                frame[1] = node
+                self.stack.append(node.row)
+                self.cover(node.row)
+                stats.add_node(len(frames), column.idx, node.row.length)
+                break
+            else:
                 return None
 
-            for row in rows:
-                self.stack.append(row)
-                del_cols, del_rows = self.cover(row)
+    def count_solutions(self, limit: int | None = None) -> int:
+        if limit is not None and limit < 1:
+            raise ValueError("Limit must be positive.")
 
-                if result := self.algorithm_x():
-                    return result
+        base_length = len(self.stack)
+        count = 0
 
-                self.uncover(del_cols, del_rows)
-                if self.stack:
-                    self.stack.pop()
+        frames = []
+        while True:
+            if self.col_length == 0:
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+            elif (column := self.get_min_col_length()).length != 0:
+                node = column.head
+                self.stack.append(node.row)
+                self.cover(node.row)
+                frames.append([column, node])
+                continue
+
+            while frames:
+                frame = frames[-1]
+                column, node = frame
+                self.uncover(self.stack.pop())
+
+                if node is column.tail:
+                    frames.pop()
+                    continue
+
+                node = node.down
+                frame[1] = node
+                self.stack.append(node.row)
+                self.cover(node.row)
+                break
+            else:
+                break
+
+        while len(self.stack) > base_length:
+            self.uncover(self.stack.pop())
+
+        return count
+
+    def iter_solutions(self) -> Iterator[tuple]:
+        base_length = len(self.stack)
+
+        frames = []
+        try:
+            while True:
+                if self.col_length == 0:
+                    yield tuple(self.get_stack_idxs())
+                elif (column := self.get_min_col_length()).length != 0:
+                    node = column.head
+                    self.stack.append(node.row)
+                    self.cover(node.row)
+                    frames.append([column, node])
+                    continue
+
+                while frames:
+                    frame = frames[-1]
+                    column, node = frame
+                    self.uncover(self.stack.pop())
+
+                    if node is column.tail:
+                        frames.pop()
+                        continue
+
+                    node = node.down
+                    frame[1] = node
+                    self.stack.append(node.row)
+                    self.cover(node.row)
+                    break
+                else:
+                    return None
+        finally:
+            while len(self.stack) > base_length:
+                self.uncover(self.stack.pop())
 
 
 def test_1() -> None:
@@ -1131,11 +1446,12 @@ def test_3() -> None:
 
     print(dancing_links_list)
 
-    deletes = dancing_links_list.cover(dancing_links_list.get_row(2))
+    row = dancing_links_list.get_row(2)
+    dancing_links_list.cover(row)
 
     print(dancing_links_list)
 
-    dancing_links_list.uncover(*deletes)
+    dancing_links_list.uncover(row)
 
     print(dancing_links_list)
 
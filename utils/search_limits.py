@@ -0,0 +1,80 @@
+import threading
+import time
+
+from .search_stats import SearchStats
+
+
+class CancellationToken:
+    def __init__(self, event: threading.Event | None = None) -> None:
+        self.event = threading.Event() if event is None else event
+
+    def __repr__(self) -> str:
+        return f"CancellationToken(cancelled={self.is_cancelled()})"
+
+    def cancel(self) -> None:
+        self.event.set()
+
+    def is_cancelled(self) -> bool:
+        return self.event.is_set()
+
+
+class SearchLimits:
+    def __init__(
+        self,
+        timeout: float | None = None,
+        max_nodes: int | None = None,
+        token: CancellationToken | None = None,
+        check_interval: int = 256,
+    ) -> None:
+        if timeout is not None and timeout < 0:
+            raise ValueError("Timeout must be non-negative")
+
+        if max_nodes is not None and max_nodes < 0:
+            raise ValueError("Max nodes must be non-negative")
+
+        if check_interval < 1:
+            raise ValueError("Check interval must be positive")
+
+        self.timeout = timeout
+        self.max_nodes = max_nodes
+        self.token = token
+        self.check_interval = check_interval
+        self.deadline = None
+        self.reason = None
+        self.start()
+
+    def __repr__(self) -> str:
+        return f"SearchLimits(deadline={self.deadline}, max_nodes={self.max_nodes}, reason={self.reason})"
+
+    def start(self) -> None:
+        self.deadline = None if self.timeout is None else time.perf_counter() + self.timeout
+        self.reason = None
+
+    def get_next_check(self, nodes: int) -> int:
+        next_check = nodes + self.check_interval
+        if self.max_nodes is not None:
+            next_check = min(next_check, self.max_nodes)
+
+        return next_check
+
+    def check(self, nodes: int) -> bool:
+        if self.max_nodes is not None and nodes >= self.max_nodes:
+            self.reason = "nodes"
+        elif self.token is not None and self.token.is_cancelled():
+            self.reason = "cancelled"
+        elif self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.reason = "deadline"
+
+        return self.reason is not None
+
+
+class TimedOut:
+    def __init__(self, reason: str, stats: SearchStats) -> None:
+        self.reason = reason
+        self.stats = stats
+
+    def __repr__(self) -> str:
+        return f"TimedOut(reason={self.reason!r}, stats={self.stats!r})"
+
+    def __bool__(self) -> bool:
+        return False
@@ -0,0 +1,51 @@
+class SearchStats:
+    def __init__(self) -> None:
+        self.nodes = 0
+        self.covers = 0
+        self.uncovers = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.rows_tried = {}
+        self.depth_branches = []
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchStats(nodes={self.nodes}, covers={self.covers}, uncovers={self.uncovers}, "
+            f"backtracks={self.backtracks}, max_depth={self.max_depth}, branching={self.get_branching():.3f})"
+        )
+
+    def add_branch(self, depth: int, col_length: int) -> None:
+        while len(self.depth_branches) <= depth:
+            self.depth_branches.append([0, 0])
+
+        self.depth_branches[depth][0] += 1
+        self.depth_branches[depth][1] += col_length
+        if col_length == 0:
+            self.backtracks += 1
+
+    def add_node(self, depth: int, col_idx: int | tuple, row_length: int) -> None:
+        self.nodes += 1
+        self.covers += row_length
+        self.max_depth = max(self.max_depth, depth)
+        self.rows_tried[col_idx] = self.rows_tried.get(col_idx, 0) + 1
+
+    def get_branching(self) -> float:
+        branch_points = sum(points for points, _ in self.depth_branches)
+        if branch_points == 0:
+            return 0.0
+
+        return sum(rows for _, rows in self.depth_branches) / branch_points
+
+    def get_depth_branching(self) -> list[float]:
+        return [rows / points if points else 0.0 for points, rows in self.depth_branches]
+
+    def as_dict(self) -> dict:
+        return {
+            "nodes": self.nodes,
+            "covers": self.covers,
+            "uncovers": self.uncovers,
+            "backtracks": self.backtracks,
+            "max_depth": self.max_depth,
+            "branching": self.get_branching(),
+            "depth_branching": self.get_depth_branching(),
+        }
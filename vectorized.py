@@ -0,0 +1,179 @@
+from math import isqrt, prod
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from sudoku import Sudoku
+
+
+class Violation(NamedTuple):
+    kind: str
+    idx: int | tuple[int, int]
+
+
+class Validation(NamedTuple):
+    valid: np.ndarray
+    violations: list[Violation | None]
+
+
+def get_quad_dim(grids: np.ndarray) -> int:
+    if grids.ndim != 3 or grids.shape[1] != grids.shape[2]:
+        raise ValueError("Grids must have shape (N, n, n).")
+
+    quad_dim = isqrt(grids.shape[1])
+    if quad_dim < 1 or quad_dim**2 != grids.shape[1]:
+        raise ValueError("Grid side must be a square of an int.")
+
+    return quad_dim
+
+
+def to_boxes(grids: np.ndarray, quad_dim: int) -> np.ndarray:
+    length = len(grids)
+    dim = quad_dim**2
+    boxes = grids.reshape(length, quad_dim, quad_dim, quad_dim, quad_dim).transpose(0, 1, 3, 2, 4)
+    return boxes.reshape(length, dim, dim)
+
+
+def get_bad_units(masks: np.ndarray) -> np.ndarray:
+    full_mask = (1 << masks.shape[2] + 1) - 2
+    return np.bitwise_or.reduce(masks, axis=2) != full_mask
+
+
+def validate_grids(grids: ArrayLike, puzzles: ArrayLike | None = None) -> Validation:
+    grids = np.asarray(grids)
+    quad_dim = get_quad_dim(grids)
+    dim = quad_dim**2
+
+    bad_range = (grids < 1) | (grids > dim)
+    checks = [("range", bad_range)]
+    if puzzles is not None:
+        if (puzzles := np.asarray(puzzles)).shape != grids.shape:
+            raise ValueError("Puzzles must have the same shape as grids.")
+
+        checks.append(("clue", (puzzles != 0) & (puzzles != grids)))
+
+    masks = np.left_shift(1, np.where(bad_range, 0, grids), dtype=np.int64)
+    checks.append(("row", get_bad_units(masks)))
+    checks.append(("col", get_bad_units(masks.transpose(0, 2, 1))))
+    checks.append(("box", get_bad_units(to_boxes(masks, quad_dim))))
+
+    flat_checks = [(kind, bad.reshape(len(grids), prod(bad.shape[1:]))) for kind, bad in checks]
+    failed = np.zeros(len(grids), dtype=bool)
+    for _, bad in flat_checks:
+        failed |= bad.any(axis=1)
+
+    violations = [None] * len(grids)
+    for grid in np.flatnonzero(failed):
+        for kind, bad in flat_checks:
+            if not bad[grid].any():
+                continue
+
+            pos = int(bad[grid].argmax())
+            if kind in ("range", "clue"):
+                violations[grid] = Violation(kind, (pos // dim + 1, pos % dim + 1))
+            else:
+                violations[grid] = Violation(kind, pos + 1)
+            break
+
+    return Validation(~failed, violations)
+
+
+def get_candidates(puzzles: ArrayLike) -> np.ndarray:
+    puzzles = np.asarray(puzzles)
+    dim = get_quad_dim(puzzles) ** 2
+    if ((puzzles < 0) | (puzzles > dim)).any():
+        raise ValueError(f"Puzzle values must be between 0 and {dim}.")
+
+    values = np.arange(1, dim + 1)
+    return (puzzles[..., None] == values) | (puzzles[..., None] == 0)
+
+
+def get_unit_counts(candidates: np.ndarray, quad_dim: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    length = len(candidates)
+    dim = quad_dim**2
+    quads = candidates.reshape(length, quad_dim, quad_dim, quad_dim, quad_dim, dim)
+
+    row_counts = candidates.sum(axis=2, dtype=np.int16)
+    col_counts = candidates.sum(axis=1, dtype=np.int16)
+    quad_counts = quads.sum(axis=(2, 4), dtype=np.int16)
+    return row_counts, col_counts, quad_counts
+
+
+def spread_units(rows: np.ndarray, cols: np.ndarray, quads: np.ndarray, quad_dim: int) -> np.ndarray:
+    quads = np.repeat(np.repeat(quads, quad_dim, axis=1), quad_dim, axis=2)
+    return rows[:, :, None, :] | cols[:, None, :, :] | quads
+
+
+def any_per_grid(mask: np.ndarray) -> np.ndarray:
+    return mask.reshape(len(mask), prod(mask.shape[1:])).any(axis=1)
+
+
+def propagate_candidates(candidates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    quad_dim = isqrt(candidates.shape[1])
+    candidates = candidates.copy()
+    dead = np.zeros(len(candidates), dtype=bool)
+    active = np.arange(len(candidates))
+
+    while len(active):
+        current = candidates[active]
+        cell_counts = current.sum(axis=3, dtype=np.int16)
+        placed = current & (cell_counts == 1)[..., None]
+
+        placed_counts = get_unit_counts(placed, quad_dim)
+        candidate_counts = get_unit_counts(current, quad_dim)
+
+        is_dead = any_per_grid(cell_counts == 0)
+        for counts in placed_counts:
+            is_dead |= any_per_grid(counts > 1)
+        for counts in candidate_counts:
+            is_dead |= any_per_grid(counts == 0)
+
+        peers = spread_units(*(counts > 0 for counts in placed_counts), quad_dim)
+        hidden = current & spread_units(*(counts == 1 for counts in candidate_counts), quad_dim)
+
+        updated = (current & ~peers) | placed
+        updated = np.where(hidden.any(axis=3, keepdims=True), hidden & updated, updated)
+        updated[is_dead] = False
+
+        is_changed = any_per_grid(updated != current)
+        candidates[active] = updated
+        dead[active] = is_dead
+        active = active[is_changed & ~is_dead]
+
+    return candidates, dead
+
+
+def candidates_to_grids(candidates: np.ndarray) -> np.ndarray:
+    solved = candidates.sum(axis=3) == 1
+    return np.where(solved, candidates.argmax(axis=3) + 1, 0)
+
+
+def solve_batch(puzzles: ArrayLike, engine: str = "array") -> list[list[list[int]] | None]:
+    puzzles = np.asarray(puzzles)
+    quad_dim = get_quad_dim(puzzles)
+
+    candidates, dead = propagate_candidates(get_candidates(puzzles))
+    grids = candidates_to_grids(candidates)
+    filled = (grids != 0).all(axis=(1, 2))
+
+    sudoku = Sudoku(quad_dim, engine=engine)
+    solutions = []
+    for grid, is_dead, is_filled in zip(grids.tolist(), dead, filled):
+        if is_dead:
+            solutions.append(None)
+            continue
+
+        if is_filled:
+            solutions.append(grid)
+            continue
+
+        sudoku.set_field(grid)
+        if not sudoku.xsolve():
+            solutions.append(None)
+            continue
+
+        sudoku.xfield_to_field()
+        solutions.append(sudoku.get_field())
+
+    return solutions